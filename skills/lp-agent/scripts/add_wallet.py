@@ -18,6 +18,9 @@ Usage:
     # Get wallet balances for all tokens
     python add_wallet.py balances --address <WALLET_ADDRESS> --all
 
+    # Get balances for several wallets in one request
+    python add_wallet.py balances --address <ADDRESS_1> <ADDRESS_2>
+
 Environment:
     HUMMINGBOT_API_URL - API base URL (default: http://localhost:8000)
     API_USER - API username (default: admin)
@@ -72,7 +75,7 @@ def api_request(method: str, endpoint: str, data=None) -> dict:
 
     try:
         with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
+            return json.loads(resp.read())
     except urllib.error.HTTPError as e:
         error_body = e.read().decode() if e.fp else ""
         print(f"Error: HTTP {e.code} - {e.reason}", file=sys.stderr)
@@ -182,11 +185,14 @@ def get_balances(args):
     print("Wallet Balances")
     print("-" * 50)
 
+    # One portfolio call covers every wallet; filter per address client-side
+    needles = set(args.address or [])
+
     for account_name, connectors in result.items():
         print(f"\nAccount: {account_name}")
         for connector_name, tokens in connectors.items():
-            # Filter to show only gateway connectors if address is specified
-            if args.address and args.address not in connector_name:
+            # Filter to show only gateway connectors if addresses are specified
+            if needles and not any(n in connector_name for n in needles):
                 continue
             print(f"  Connector: {connector_name}")
             if isinstance(tokens, list):
@@ -204,30 +210,50 @@ def get_balances(args):
                         print(f"    {symbol}: {balance}")
 
 
-def main():
+def _add_list_args(parser):
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+
+def _add_add_args(parser):
+    parser.add_argument("--private-key", help="Private key (base58). Omit to be prompted securely.")
+    parser.add_argument("--chain", default="solana", help="Blockchain (default: solana)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+
+def _add_balances_args(parser):
+    parser.add_argument("--account", default="master_account", help="Account name (default: master_account)")
+    parser.add_argument("--address", nargs="+", help="Filter by wallet address(es) (optional)")
+    parser.add_argument("--all", action="store_true", help="Show zero balances too")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+
+# command -> (handler, help, argument builder)
+COMMANDS = {
+    "list": (list_wallets, "List connected wallets", _add_list_args),
+    "add": (add_wallet, "Add a wallet", _add_add_args),
+    "balances": (get_balances, "Get wallet balances", _add_balances_args),
+}
+
+
+def build_parser(command=None):
+    """Build the CLI parser. If command is given, only its subparser is built."""
     parser = argparse.ArgumentParser(description="Add and manage wallets via hummingbot-api Gateway")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # list command
-    list_parser = subparsers.add_parser("list", help="List connected wallets")
-    list_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    list_parser.set_defaults(func=list_wallets)
-
-    # add command
-    add_parser = subparsers.add_parser("add", help="Add a wallet")
-    add_parser.add_argument("--private-key", help="Private key (base58). Omit to be prompted securely.")
-    add_parser.add_argument("--chain", default="solana", help="Blockchain (default: solana)")
-    add_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    add_parser.set_defaults(func=add_wallet)
-
-    # balances command
-    bal_parser = subparsers.add_parser("balances", help="Get wallet balances")
-    bal_parser.add_argument("--account", default="master_account", help="Account name (default: master_account)")
-    bal_parser.add_argument("--address", help="Filter by wallet address (optional)")
-    bal_parser.add_argument("--all", action="store_true", help="Show zero balances too")
-    bal_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    bal_parser.set_defaults(func=get_balances)
+    for name, (func, help_text, add_args) in COMMANDS.items():
+        if command and name != command:
+            continue
+        sub = subparsers.add_parser(name, help=help_text)
+        add_args(sub)
+        sub.set_defaults(func=func)
 
+    return parser
+
+
+def main():
+    # Known verb: skip building the other subparsers. Help/unknown input gets the full parser.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    parser = build_parser(command if command in COMMANDS else None)
     args = parser.parse_args()
     args.func(args)
 
@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Export a single LP executor to CSV by executor ID.
+Export LP executors to CSV by executor ID.
 
 Fetches from the Hummingbot REST API — no SQLite database required.
 
@@ -8,6 +8,7 @@ Usage:
     python scripts/export_lp_executor.py --id <executor_id>
     python scripts/export_lp_executor.py --id <executor_id> --output exports/my_run.csv
     python scripts/export_lp_executor.py --id <executor_id> --print
+    python scripts/export_lp_executor.py --ids <id1>,<id2>,<id3>   # one request, one CSV
 
 CSV columns (LP executor schema):
   Identity:   id, account_name, controller_id, connector_name, trading_pair
@@ -28,21 +29,31 @@ CSV columns (LP executor schema):
 
 import argparse
 import base64
+import calendar
 import csv
+import functools
+import gzip
 import json
 import os
 import sys
 import urllib.request
 import urllib.error
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 # ---------------------------------------------------------------------------
 # Auth / config  (HUMMINGBOT_API_URL / API_USER / API_PASS — same as other lp-agent scripts)
 # ---------------------------------------------------------------------------
 
+_ENV_LOADED = False
+
+
 def load_env():
-    """Load environment from .env files (first found wins)."""
+    """Load environment from .env files (first found wins). Only runs once per process."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     for path in [".env", os.path.expanduser("~/.hummingbot/.env"), os.path.expanduser("~/.env")]:
         if os.path.exists(path):
             with open(path) as f:
@@ -69,21 +80,50 @@ def make_auth_header(cfg):
     return f"Basic {creds}"
 
 
+@functools.lru_cache(maxsize=1)
+def get_request_headers():
+    """Headers shared by every API call — built once per process."""
+    return {
+        "Authorization": make_auth_header(get_api_config()),
+        "Accept-Encoding": "gzip",
+    }
+
+
 # ---------------------------------------------------------------------------
 # API
 # ---------------------------------------------------------------------------
 
 def api_get(url, headers, timeout=30):
     req = urllib.request.Request(url, headers=headers, method="GET")
+    return _urlopen_json(req, timeout)
+
+
+def api_post(url, headers, payload, timeout=30):
+    req = urllib.request.Request(
+        url, data=json.dumps(payload).encode(),
+        headers={**headers, "Content-Type": "application/json"}, method="POST",
+    )
+    return _urlopen_json(req, timeout)
+
+
+def _urlopen_json(req, timeout):
     try:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
+            return json.loads(_read_body(resp))
     except urllib.error.HTTPError as e:
-        raise RuntimeError(f"HTTP {e.code}: {e.read().decode(errors='replace')}") from e
+        raise RuntimeError(f"HTTP {e.code}: {_read_body(e).decode(errors='replace')}") from e
     except urllib.error.URLError as e:
         raise RuntimeError(f"Connection error: {e.reason}") from e
 
 
+def _read_body(resp):
+    """Read the response body, inflating it if the server honoured Accept-Encoding: gzip."""
+    body = resp.read()
+    if resp.headers.get("Content-Encoding") == "gzip":
+        body = gzip.decompress(body)
+    return body
+
+
 def fetch_executor(base_url, hdrs, executor_id):
     """GET /executors/{id} — returns the executor dict."""
     raw = api_get(f"{base_url}/executors/{executor_id}", hdrs)
@@ -96,11 +136,41 @@ def fetch_executor(base_url, hdrs, executor_id):
     return raw
 
 
+def fetch_executors(base_url, hdrs, executor_ids, limit=1000):
+    """POST /executors/search once and pick out executor_ids client-side.
+
+    Returns (executors in requested order, ids that were not found).
+    """
+    wanted = set(executor_ids)
+    found = {}
+    payload = {"executor_types": ["lp_executor"], "limit": limit}
+    while True:
+        raw = api_post(f"{base_url}/executors/search", hdrs, payload)
+        items = raw.get("data", []) if isinstance(raw, dict) else raw
+        for ex in items or []:
+            ex_id = ex.get("executor_id") or ex.get("id")
+            if ex_id in wanted:
+                found[ex_id] = ex
+        pagination = raw.get("pagination", {}) if isinstance(raw, dict) else {}
+        cursor = pagination.get("next_cursor")
+        if len(found) == len(wanted) or not pagination.get("has_more") or not cursor:
+            break
+        payload["cursor"] = cursor
+
+    missing = [i for i in executor_ids if i not in found]
+    return [found[i] for i in executor_ids if i in found], missing
+
+
 # ---------------------------------------------------------------------------
 # Schema helpers
 # ---------------------------------------------------------------------------
 
 def _f(v, d=None):
+    # JSON numbers arrive as float/int already — skip the try/float() round-trip.
+    if type(v) is float:
+        return v
+    if type(v) is int:
+        return float(v)
     if v is None or v == "":
         return d
     try:
@@ -109,98 +179,56 @@ def _f(v, d=None):
         return d
 
 
-def _s(v):
-    return str(v) if v is not None else ""
-
-
 def _b(v):
     if v is None:
-        return ""
+        return None
     return "true" if v else "false"
 
 
+def _parse_ts_fast(s):
+    """Slice the API's fixed YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+00:00] layout; None if it doesn't match."""
+    if s.endswith("Z"):
+        s = s[:-1]
+    elif s.endswith("+00:00"):
+        s = s[:-6]
+    if len(s) < 19 or s[4] != "-" or s[7] != "-" or s[10] not in "T " or s[13] != ":" or s[16] != ":":
+        return None
+    # Plain ASCII digits only: int() would also accept signs, whitespace and non-ASCII digits
+    digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    try:
+        # datetime() range-checks every field (no Feb 30 or hour 25), unlike calendar.timegm
+        ts = datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                      int(s[11:13]), int(s[14:16]), int(s[17:19]), tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return None
+    if len(s) == 19:
+        return ts
+    frac = s[20:]
+    if s[19] != "." or not (frac.isascii() and frac.isdigit()):
+        return None
+    return ts + int(frac[:6].ljust(6, "0")) / 1e6
+
+
+@functools.lru_cache(maxsize=4096)
 def parse_ts(s):
     if not s:
         return None
+    fast = _parse_ts_fast(str(s))
+    if fast is not None:
+        return fast
     try:
         clean = str(s).replace("+00:00", "").replace("Z", "")
         if "." in clean:
             p = clean.split(".")
             clean = p[0] + "." + p[1][:6]
-        import calendar
         dt = datetime.fromisoformat(clean)
         return calendar.timegm(dt.timetuple()) + dt.microsecond / 1e6
     except Exception:
         return None
 
 
-def to_row(ex):
-    cfg = ex.get("config") or {}
-    ci = ex.get("custom_info") or {}
-
-    created_ts = parse_ts(ex.get("created_at"))
-    close_ts = _f(ex.get("close_timestamp")) or parse_ts(ex.get("closed_at"))
-    closed_at = _s(ex.get("closed_at"))
-    if not closed_at and close_ts:
-        closed_at = datetime.utcfromtimestamp(close_ts).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
-
-    duration = None
-    if created_ts and close_ts and close_ts > created_ts:
-        duration = round(close_ts - created_ts, 1)
-
-    return {
-        "id":                              _s(ex.get("executor_id") or ex.get("id")),
-        "account_name":                    _s(ex.get("account_name")),
-        "controller_id":                   _s(ex.get("controller_id")),
-        "connector_name":                  _s(ex.get("connector_name")),
-        "trading_pair":                    _s(ex.get("trading_pair")),
-        "status":                          _s(ex.get("status")),
-        "close_type":                      _s(ex.get("close_type")),
-        "is_active":                       _b(ex.get("is_active")),
-        "is_trading":                      _b(ex.get("is_trading")),
-        "error_count":                     ex.get("error_count", 0),
-        "created_at":                      _s(ex.get("created_at")),
-        "closed_at":                       closed_at,
-        "close_timestamp":                 close_ts,
-        "duration_seconds":                duration,
-        "net_pnl_quote":                   _f(ex.get("net_pnl_quote")),
-        "net_pnl_pct":                     _f(ex.get("net_pnl_pct")),
-        "cum_fees_quote":                  _f(ex.get("cum_fees_quote")),
-        "filled_amount_quote":             _f(ex.get("filled_amount_quote")),
-        # config
-        "pool_address":                    _s(cfg.get("pool_address")),
-        "lower_price":                     _f(cfg.get("lower_price")),
-        "upper_price":                     _f(cfg.get("upper_price")),
-        "base_amount_config":              _f(cfg.get("base_amount")),
-        "quote_amount_config":             _f(cfg.get("quote_amount")),
-        "side":                            cfg.get("side"),
-        "position_offset_pct":             _f(cfg.get("position_offset_pct")),
-        "auto_close_above_range_seconds":  cfg.get("auto_close_above_range_seconds"),
-        "auto_close_below_range_seconds":  cfg.get("auto_close_below_range_seconds"),
-        "keep_position":                   _b(cfg.get("keep_position")),
-        # custom_info
-        "state":                           _s(ci.get("state")),
-        "position_address":                _s(ci.get("position_address")),
-        "current_price":                   _f(ci.get("current_price")),
-        "lower_price_actual":              _f(ci.get("lower_price")),
-        "upper_price_actual":              _f(ci.get("upper_price")),
-        "base_amount_current":             _f(ci.get("base_amount")),
-        "quote_amount_current":            _f(ci.get("quote_amount")),
-        "base_fee":                        _f(ci.get("base_fee")),
-        "quote_fee":                       _f(ci.get("quote_fee")),
-        "fees_earned_quote":               _f(ci.get("fees_earned_quote")),
-        "total_value_quote":               _f(ci.get("total_value_quote")),
-        "unrealized_pnl_quote":            _f(ci.get("unrealized_pnl_quote")),
-        "position_rent":                   _f(ci.get("position_rent")),
-        "position_rent_refunded":          _f(ci.get("position_rent_refunded")),
-        "tx_fee":                          _f(ci.get("tx_fee")),
-        "out_of_range_seconds":            _f(ci.get("out_of_range_seconds")),
-        "max_retries_reached":             _b(ci.get("max_retries_reached")),
-        "initial_base_amount":             _f(ci.get("initial_base_amount")),
-        "initial_quote_amount":            _f(ci.get("initial_quote_amount")),
-    }
-
-
 CSV_COLUMNS = [
     "id", "account_name", "controller_id", "connector_name", "trading_pair",
     "status", "close_type", "is_active", "is_trading", "error_count",
@@ -221,26 +249,116 @@ CSV_COLUMNS = [
 ]
 
 
+def to_row(ex):
+    """Build a CSV row (tuple in CSV_COLUMNS order) from an executor dict.
+
+    Missing or empty values are None in every column: csv.writer writes them as
+    an empty cell and --print shows null.
+    """
+    cfg = ex.get("config") or {}
+    ci = ex.get("custom_info") or {}
+
+    created_ts = parse_ts(ex.get("created_at"))
+    close_ts = _f(ex.get("close_timestamp")) or parse_ts(ex.get("closed_at"))
+    closed_at = ex.get("closed_at") or None
+    if not closed_at and close_ts:
+        closed_at = datetime.fromtimestamp(close_ts, timezone.utc).isoformat(timespec="microseconds")
+
+    duration = None
+    if created_ts and close_ts and close_ts > created_ts:
+        duration = round(close_ts - created_ts, 1)
+
+    return (
+        ex.get("executor_id") or ex.get("id") or None,
+        ex.get("account_name"),
+        ex.get("controller_id"),
+        ex.get("connector_name"),
+        ex.get("trading_pair"),
+        ex.get("status") or None,
+        ex.get("close_type") or None,
+        _b(ex.get("is_active")),
+        _b(ex.get("is_trading")),
+        ex.get("error_count", 0),
+        ex.get("created_at"),
+        closed_at,
+        close_ts,
+        duration,
+        _f(ex.get("net_pnl_quote")),
+        _f(ex.get("net_pnl_pct")),
+        _f(ex.get("cum_fees_quote")),
+        _f(ex.get("filled_amount_quote")),
+        # config
+        cfg.get("pool_address") or None,
+        _f(cfg.get("lower_price")),
+        _f(cfg.get("upper_price")),
+        _f(cfg.get("base_amount")),
+        _f(cfg.get("quote_amount")),
+        cfg.get("side"),
+        _f(cfg.get("position_offset_pct")),
+        cfg.get("auto_close_above_range_seconds"),
+        cfg.get("auto_close_below_range_seconds"),
+        _b(cfg.get("keep_position")),
+        # custom_info
+        ci.get("state") or None,
+        ci.get("position_address"),
+        _f(ci.get("current_price")),
+        _f(ci.get("lower_price")),
+        _f(ci.get("upper_price")),
+        _f(ci.get("base_amount")),
+        _f(ci.get("quote_amount")),
+        _f(ci.get("base_fee")),
+        _f(ci.get("quote_fee")),
+        _f(ci.get("fees_earned_quote")),
+        _f(ci.get("total_value_quote")),
+        _f(ci.get("unrealized_pnl_quote")),
+        _f(ci.get("position_rent")),
+        _f(ci.get("position_rent_refunded")),
+        _f(ci.get("tx_fee")),
+        _f(ci.get("out_of_range_seconds")),
+        _b(ci.get("max_retries_reached")),
+        _f(ci.get("initial_base_amount")),
+        _f(ci.get("initial_quote_amount")),
+    )
+
+
+def write_csv(output_path, rows):
+    """Write CSV_COLUMNS header plus rows (any iterable of to_row tuples)."""
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    with open(output_path, "w", newline="", buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_COLUMNS)
+        writer.writerows(rows)
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
 def main():
     parser = argparse.ArgumentParser(
-        description="Export a single LP executor to CSV by ID",
+        description="Export LP executors to CSV by ID",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__,
     )
-    parser.add_argument("--id", dest="executor_id", required=True,
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--id", dest="executor_id",
                         help="Executor ID to export")
+    target.add_argument("--ids",
+                        help="Comma-separated executor IDs to export into one CSV (single search request)")
     parser.add_argument("--output", "-o",
                         help="Output CSV path (default: data/lp_executor_<id[:10]>_<ts>.csv)")
     parser.add_argument("--print", dest="print_only", action="store_true",
-                        help="Print row as JSON instead of writing CSV")
+                        help="Print row(s) as JSON instead of writing CSV")
     args = parser.parse_args()
 
     cfg = get_api_config()
-    hdrs = {"Authorization": make_auth_header(cfg)}
+    hdrs = get_request_headers()
+
+    if args.ids:
+        return export_many(cfg, hdrs, args)
 
     print(f"Fetching executor {args.executor_id} from {cfg['url']} ...")
     try:
@@ -256,7 +374,7 @@ def main():
     row = to_row(ex)
 
     if args.print_only:
-        print(json.dumps(row, indent=2, default=str))
+        print(json.dumps(dict(zip(CSV_COLUMNS, row)), indent=2, default=str))
         return 0
 
     output_path = args.output
@@ -265,18 +383,48 @@ def main():
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = f"data/lp_executor_{args.executor_id[:10]}_{ts}.csv"
 
-    output_dir = os.path.dirname(output_path)
-    if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
-
-    with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=CSV_COLUMNS, extrasaction="ignore")
-        writer.writeheader()
-        writer.writerow(row)
+    write_csv(output_path, [row])
 
     print(f"Exported to: {output_path}")
     return 0
 
 
+def export_many(cfg, hdrs, args):
+    """--ids: fetch all executors with one search request and write a single CSV."""
+    executor_ids = list(dict.fromkeys(i.strip() for i in args.ids.split(",") if i.strip()))
+    if not executor_ids:
+        print("Error: --ids is empty", file=sys.stderr)
+        return 1
+
+    print(f"Fetching {len(executor_ids)} executors from {cfg['url']} ...")
+    try:
+        executors, missing = fetch_executors(cfg["url"], hdrs, executor_ids)
+    except RuntimeError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    for ex_id in missing:
+        print(f"Executor not found: {ex_id}", file=sys.stderr)
+    if not executors:
+        return 1
+
+    if args.print_only:
+        rows = [dict(zip(CSV_COLUMNS, to_row(ex))) for ex in executors]
+        print(json.dumps(rows, indent=2, default=str))
+        return 0
+
+    output_path = args.output
+    if not output_path:
+        os.makedirs("data", exist_ok=True)
+        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_path = f"data/lp_executors_{ts}.csv"
+
+    # Rows are built lazily as the writer consumes them — no second list of tuples.
+    write_csv(output_path, (to_row(ex) for ex in executors))
+
+    print(f"Exported {len(executors)} executors to: {output_path}")
+    return 0
+
+
 if __name__ == "__main__":
     sys.exit(main())
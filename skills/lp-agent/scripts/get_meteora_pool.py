@@ -12,25 +12,68 @@ Examples:
 """
 
 import argparse
+import bisect
+import functools
+import hashlib
 import json
+import re
+import time
 import urllib.request
-import urllib.parse
+import urllib.error
 import os
+import sys
 
 METEORA_API = "https://dlmm.datapi.meteora.ag"
 GATEWAY_HOST = os.environ.get("GATEWAY_HOST", "localhost")
 GATEWAY_PORT = os.environ.get("GATEWAY_PORT", "15888")
 
+# Solana pubkey: 32-44 base58 characters (no 0, O, I, l)
+_ADDRESS_RE = re.compile(r"[1-9A-HJ-NP-Za-km-z]{32,44}")
+
+# On-disk cache for Meteora API responses (override TTL with METEORA_CACHE_TTL, 0 disables)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hummingbot-skills", "meteora")
+DEFAULT_CACHE_TTL = 15
+
+
+# Scripts here are standalone, so _cached_get is duplicated: keep it identical to list_meteora_pools.py
+def _cached_get(url: str, headers: dict, timeout: int = 30) -> bytes:
+    """GET url, reusing a response cached on disk for METEORA_CACHE_TTL seconds (0 disables)."""
+    try:
+        ttl = float(os.environ.get("METEORA_CACHE_TTL", DEFAULT_CACHE_TTL))
+    except ValueError:
+        ttl = DEFAULT_CACHE_TTL
+    path = os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".json")
+    if ttl > 0:
+        try:
+            if time.time() - os.path.getmtime(path) < ttl:
+                with open(path, "rb") as f:
+                    return f.read()
+        except OSError:
+            pass
+
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        body = resp.read()
+
+    if ttl > 0:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return body
+
 
 def fetch_pool_meteora(address: str) -> dict:
     """Fetch pool details from Meteora DLMM API."""
     url = f"{METEORA_API}/pools/{address}"
-    req = urllib.request.Request(url, headers={
+    return json.loads(_cached_get(url, headers={
         "Accept": "application/json",
         "User-Agent": "Mozilla/5.0 (compatible; hummingbot-skills/1.0)",
-    })
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read().decode())
+    }))
 
 
 def fetch_pool_gateway(address: str) -> tuple:
@@ -42,31 +85,49 @@ def fetch_pool_gateway(address: str) -> tuple:
     req = urllib.request.Request(url, headers={"Accept": "application/json"})
     try:
         with urllib.request.urlopen(req, timeout=10) as resp:
-            return json.loads(resp.read().decode()), None
+            return json.loads(resp.read()), None
     except urllib.error.URLError as e:
         return None, f"Gateway not reachable at {GATEWAY_HOST}:{GATEWAY_PORT}"
     except Exception as e:
         return None, str(e)
 
 
+def _memoize(fn):
+    """lru_cache fn, calling it directly when an argument is unhashable."""
+    cached = functools.lru_cache(maxsize=512)(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return cached(*args, **kwargs)
+        except TypeError:
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+# (divisor, letter) pairs, largest first
+_SUFFIXES = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+
+@_memoize
 def format_number(value, decimals=2, prefix="", suffix=""):
     """Format number with K/M/B suffixes."""
     if value is None:
         return "—"
-    try:
-        num = float(value)
-        if num >= 1_000_000_000:
-            return f"{prefix}{num/1_000_000_000:.{decimals}f}B{suffix}"
-        elif num >= 1_000_000:
-            return f"{prefix}{num/1_000_000:.{decimals}f}M{suffix}"
-        elif num >= 1_000:
-            return f"{prefix}{num/1_000:.{decimals}f}K{suffix}"
-        else:
-            return f"{prefix}{num:.{decimals}f}{suffix}"
-    except (ValueError, TypeError):
-        return "—"
+    if isinstance(value, (int, float)):
+        num = value
+    else:
+        try:
+            num = float(value)
+        except (ValueError, TypeError):
+            return "—"
+    for divisor, letter in _SUFFIXES:
+        if num >= divisor:
+            return f"{prefix}{num/divisor:.{decimals}f}{letter}{suffix}"
+    return f"{prefix}{num:.{decimals}f}{suffix}"
 
 
+@_memoize
 def format_number_raw(value, decimals=6):
     """Format number without suffixes."""
     if value is None:
@@ -77,6 +138,7 @@ def format_number_raw(value, decimals=6):
         return "—"
 
 
+@_memoize
 def format_percent(value):
     """Format as percentage."""
     if value is None:
@@ -109,18 +171,14 @@ def format_price_subscript(price: float) -> str:
     if price >= 0.01:
         return f"{price:.4f}"
 
-    # Count leading zeros after decimal point
-    price_str = f"{price:.12f}"
-    after_decimal = price_str.split(".")[1]
-    leading_zeros = 0
-    for c in after_decimal:
-        if c == "0":
-            leading_zeros += 1
-        else:
-            break
+    # Count leading zeros after decimal point (lstrip scans in C; the string is
+    # kept rather than log10 so rounding at 12 decimals matches the display)
+    after_decimal = f"{price:.12f}".split(".")[1]
+    digits = after_decimal.lstrip("0")
+    leading_zeros = len(after_decimal) - len(digits)
 
     # Get significant digits (up to 3)
-    significant = after_decimal[leading_zeros:leading_zeros + 3]
+    significant = digits[:3]
 
     # Subscript digits
     subscripts = "₀₁₂₃₄₅₆₇₈₉"
@@ -129,119 +187,116 @@ def format_price_subscript(price: float) -> str:
     return f"0.0{sub_zeros}{significant}"
 
 
+# Chart cell by code = has_base * 2 + has_quote:
+# empty, quote only (lighter - SOL), base only (darker - Percolator), both tokens
+_BAR_CHARS = " ░▓█"
+
+
 def render_liquidity_chart(bins: list, active_bin_id: int, current_price: float, base_symbol: str = "", quote_symbol: str = "", chart_height: int = 12) -> str:
     """Render ASCII vertical bar chart showing liquidity distribution like Meteora UI."""
     if not bins:
         return "No liquidity data available."
 
-    # Calculate liquidity per bin
-    bin_data = []
-    for b in bins:
-        price = b.get("price", 0)
-        base = b.get("baseTokenAmount", 0) or 0
-        quote = b.get("quoteTokenAmount", 0) or 0
-        bin_data.append({
-            "binId": b.get("binId"),
-            "price": price,
-            "base": base,
-            "quote": quote,
-            "base_value": base * price,  # in quote terms
-            "quote_value": quote,
-        })
-
-    if not bin_data:
-        return "No liquidity data available."
+    # Pull bin fields into parallel lists ordered by price, reading each dict once
+    prices = [b.get("price", 0) for b in bins]
+    order = sorted(range(len(bins)), key=prices.__getitem__)
+    prices = [prices[i] for i in order]
+    bin_ids = [bins[i].get("binId") for i in order]
+    base_values = [(bins[i].get("baseTokenAmount", 0) or 0) * price for i, price in zip(order, prices)]  # in quote terms
+    quote_values = [bins[i].get("quoteTokenAmount", 0) or 0 for i in order]
 
-    # Sort by price
-    bin_data.sort(key=lambda x: x["price"])
+    # Find active bin index (first bin with that id)
+    index_of = {}
+    for i, bin_id in enumerate(bin_ids):
+        index_of.setdefault(bin_id, i)
+    active_idx = index_of.get(active_bin_id)
 
     # Sample to ~60 bins centered on active
     max_bins = 60
-    if len(bin_data) > max_bins:
-        active_idx = next((i for i, b in enumerate(bin_data) if b["binId"] == active_bin_id), len(bin_data) // 2)
+    if len(prices) > max_bins:
+        center = active_idx if active_idx is not None else len(prices) // 2
         half = max_bins // 2
-        start = max(0, active_idx - half)
-        end = min(len(bin_data), start + max_bins)
+        start = max(0, center - half)
+        end = min(len(prices), start + max_bins)
         if end - start < max_bins:
             start = max(0, end - max_bins)
-        bin_data = bin_data[start:end]
+        prices = prices[start:end]
+        base_values = base_values[start:end]
+        quote_values = quote_values[start:end]
+        # The window always contains the active bin, so just re-base its index
+        if active_idx is not None:
+            active_idx -= start
 
     # Find max values for scaling
-    max_base = max((b["base_value"] for b in bin_data), default=0)
-    max_quote = max((b["quote_value"] for b in bin_data), default=0)
-    max_val = max(max_base, max_quote, 0.0001)
-
-    # Find active bin index
-    active_idx = next((i for i, b in enumerate(bin_data) if b["binId"] == active_bin_id), None)
+    max_val = max(max(base_values), max(quote_values), 0.0001)
 
     lines = []
     lines.append("Liquidity Distribution")
     lines.append(f"▓ {base_symbol}  ░ {quote_symbol}  │ Current Price: {format_price_subscript(current_price)} {quote_symbol}/{base_symbol}")
     lines.append("")
 
+    # Bar height per bin = number of row thresholds the value reaches, so the
+    # row loop below compares small ints instead of recomputing float thresholds
+    thresholds = [(row / chart_height) * max_val for row in range(1, chart_height + 1)]
+    base_heights = [bisect.bisect_right(thresholds, v) for v in base_values]
+    quote_heights = [bisect.bisect_right(thresholds, v) for v in quote_values]
+
     # Build vertical bar chart (row by row from top)
     for row in range(chart_height, 0, -1):
-        threshold = (row / chart_height) * max_val
         row_chars = []
 
-        for i, b in enumerate(bin_data):
-            is_active = (i == active_idx)
-            base_val = b["base_value"]
-            quote_val = b["quote_value"]
-
-            # Determine character
-            if base_val >= threshold and quote_val >= threshold:
-                char = "█"  # Both tokens
-            elif quote_val >= threshold:
-                char = "░"  # Quote only (lighter - SOL)
-            elif base_val >= threshold:
-                char = "▓"  # Base only (darker - Percolator)
-            elif is_active:
-                char = "│"  # Active price line
+        for i in range(len(prices)):
+            code = (base_heights[i] >= row) * 2 + (quote_heights[i] >= row)
+            if code == 0 and i == active_idx:
+                row_chars.append("│")  # Active price line
             else:
-                char = " "
-
-            row_chars.append(char)
+                row_chars.append(_BAR_CHARS[code])
 
         lines.append("".join(row_chars))
 
     # X-axis
-    axis = list("─" * len(bin_data))
+    axis = list("─" * len(prices))
     if active_idx is not None and active_idx < len(axis):
         axis[active_idx] = "┴"
     lines.append("".join(axis))
 
     # Price labels
-    if bin_data:
-        min_p = format_price_subscript(bin_data[0]["price"])
-        max_p = format_price_subscript(bin_data[-1]["price"])
+    if prices:
+        min_p = format_price_subscript(prices[0])
+        max_p = format_price_subscript(prices[-1])
         cur_p = format_price_subscript(current_price)
 
         # Build label line
-        label_width = len(bin_data)
+        label_width = len(prices)
         if active_idx is not None:
             # Position current price label at active bin
             cur_start = max(0, active_idx - len(cur_p) // 2)
             cur_end = cur_start + len(cur_p)
 
-            label = min_p + " " * (cur_start - len(min_p))
             if cur_start > len(min_p):
-                label += cur_p
-                remaining = label_width - len(label) - len(max_p)
+                parts = [min_p, " " * (cur_start - len(min_p)), cur_p]
+                remaining = label_width - cur_end - len(max_p)
                 if remaining > 0:
-                    label += " " * remaining + max_p
+                    parts += [" " * remaining, max_p]
             else:
                 remaining = label_width - len(min_p) - len(max_p)
-                label = min_p + " " * max(1, remaining) + max_p
+                parts = [min_p, " " * max(1, remaining), max_p]
         else:
             remaining = label_width - len(min_p) - len(max_p)
-            label = min_p + " " * max(1, remaining) + max_p
+            parts = [min_p, " " * max(1, remaining), max_p]
 
-        lines.append(label)
+        lines.append("".join(parts))
 
     return "\n".join(lines)
 
 
+def write_out(text: str):
+    """Write text plus newline to stdout as one pre-encoded UTF-8 write."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write((text + "\n").encode("utf-8"))
+    sys.stdout.buffer.flush()
+
+
 def print_summary_table(pool: dict, gateway: dict = None, gateway_error: str = None):
     """Print pool summary as markdown table."""
     name = pool.get("name", "Unknown")
@@ -253,79 +308,80 @@ def print_summary_table(pool: dict, gateway: dict = None, gateway_error: str = N
     fees = pool.get("fees", {})
     fee_tvl = pool.get("fee_tvl_ratio", {})
 
-    print(f"\n## {name}")
-    print(f"**Address:** `{address}`")
-    print(f"**Solscan:** https://solscan.io/account/{address}\n")
+    out = []
+    out.append(f"\n## {name}")
+    out.append(f"**Address:** `{address}`")
+    out.append(f"**Solscan:** https://solscan.io/account/{address}\n")
 
     # Summary Table
-    print("### Pool Summary\n")
-    print("| Metric | Value |")
-    print("|--------|-------|")
-    print(f"| Current Price | {format_number_raw(pool.get('current_price'), 4)} {token_y.get('symbol', '')}/{token_x.get('symbol', '')} |")
-    print(f"| TVL | {format_number(pool.get('tvl'), prefix='$')} |")
-    print(f"| 24h Volume | {format_number(volume.get('24h'), prefix='$')} |")
-    print(f"| 24h Fees | {format_number(fees.get('24h'), prefix='$')} |")
-    print(f"| APR | {format_percent(pool.get('apr'))} |")
-    print(f"| APY | {format_percent(pool.get('apy'))} |")
-    print(f"| Fee Tier | {format_percent(config.get('base_fee_pct'))} |")
-    print(f"| Bin Step | {config.get('bin_step', '—')} |")
+    out.append("### Pool Summary\n")
+    out.append("| Metric | Value |")
+    out.append("|--------|-------|")
+    out.append(f"| Current Price | {format_number_raw(pool.get('current_price'), 4)} {token_y.get('symbol', '')}/{token_x.get('symbol', '')} |")
+    out.append(f"| TVL | {format_number(pool.get('tvl'), prefix='$')} |")
+    out.append(f"| 24h Volume | {format_number(volume.get('24h'), prefix='$')} |")
+    out.append(f"| 24h Fees | {format_number(fees.get('24h'), prefix='$')} |")
+    out.append(f"| APR | {format_percent(pool.get('apr'))} |")
+    out.append(f"| APY | {format_percent(pool.get('apy'))} |")
+    out.append(f"| Fee Tier | {format_percent(config.get('base_fee_pct'))} |")
+    out.append(f"| Bin Step | {config.get('bin_step', '—')} |")
 
     # Max width calculation
     bin_step = config.get("bin_step")
     if bin_step:
         max_width = float(bin_step) * 69 / 100
-        print(f"| Max Range Width | ~{max_width:.1f}% |")
+        out.append(f"| Max Range Width | ~{max_width:.1f}% |")
 
-    print(f"| Has Farm | {'Yes' if pool.get('has_farm') else 'No'} |")
+    out.append(f"| Has Farm | {'Yes' if pool.get('has_farm') else 'No'} |")
 
     # Token Info Table
-    print("\n### Token Info\n")
-    print("| Token | Symbol | Mint | Price | Decimals | Market Cap |")
-    print("|-------|--------|------|-------|----------|------------|")
-    print(f"| Base (X) | {token_x.get('symbol', '?')} | `{token_x.get('address', '—')}` | ${format_number_raw(token_x.get('price'), 4)} | {token_x.get('decimals', '—')} | {format_number(token_x.get('market_cap'), prefix='$')} |")
-    print(f"| Quote (Y) | {token_y.get('symbol', '?')} | `{token_y.get('address', '—')}` | ${format_number_raw(token_y.get('price'), 4)} | {token_y.get('decimals', '—')} | {format_number(token_y.get('market_cap'), prefix='$')} |")
+    out.append("\n### Token Info\n")
+    out.append("| Token | Symbol | Mint | Price | Decimals | Market Cap |")
+    out.append("|-------|--------|------|-------|----------|------------|")
+    out.append(f"| Base (X) | {token_x.get('symbol', '?')} | `{token_x.get('address', '—')}` | ${format_number_raw(token_x.get('price'), 4)} | {token_x.get('decimals', '—')} | {format_number(token_x.get('market_cap'), prefix='$')} |")
+    out.append(f"| Quote (Y) | {token_y.get('symbol', '?')} | `{token_y.get('address', '—')}` | ${format_number_raw(token_y.get('price'), 4)} | {token_y.get('decimals', '—')} | {format_number(token_y.get('market_cap'), prefix='$')} |")
 
     # Reserves
-    print("\n### Reserves\n")
-    print("| Token | Amount | Value |")
-    print("|-------|--------|-------|")
+    out.append("\n### Reserves\n")
+    out.append("| Token | Amount | Value |")
+    out.append("|-------|--------|-------|")
     base_amount = pool.get("token_x_amount", 0)
     quote_amount = pool.get("token_y_amount", 0)
     base_price = token_x.get("price", 0) or 0
     quote_price = token_y.get("price", 0) or 0
-    print(f"| {token_x.get('symbol', 'X')} | {format_number(base_amount)} | {format_number(base_amount * base_price if base_amount and base_price else None, prefix='$')} |")
-    print(f"| {token_y.get('symbol', 'Y')} | {format_number(quote_amount)} | {format_number(quote_amount * quote_price if quote_amount and quote_price else None, prefix='$')} |")
+    out.append(f"| {token_x.get('symbol', 'X')} | {format_number(base_amount)} | {format_number(base_amount * base_price if base_amount and base_price else None, prefix='$')} |")
+    out.append(f"| {token_y.get('symbol', 'Y')} | {format_number(quote_amount)} | {format_number(quote_amount * quote_price if quote_amount and quote_price else None, prefix='$')} |")
 
     # Volume & Fees by Time Window
-    print("\n### Volume & Fees by Time Window\n")
-    print("| Window | Volume | Fees | Fee/TVL Ratio |")
-    print("|--------|--------|------|---------------|")
+    out.append("\n### Volume & Fees by Time Window\n")
+    out.append("| Window | Volume | Fees | Fee/TVL Ratio |")
+    out.append("|--------|--------|------|---------------|")
     for window in ["30m", "1h", "4h", "12h", "24h"]:
         v = format_number(volume.get(window), prefix="$")
         f = format_number(fees.get(window), prefix="$")
         r = format_percent(fee_tvl.get(window))
-        print(f"| {window} | {v} | {f} | {r} |")
+        out.append(f"| {window} | {v} | {f} | {r} |")
 
     # Cumulative Metrics
     cumulative = pool.get("cumulative_metrics", {})
     if cumulative:
-        print("\n### Cumulative Metrics (All Time)\n")
-        print("| Metric | Value |")
-        print("|--------|-------|")
-        print(f"| Total Volume | {format_number(cumulative.get('volume'), prefix='$')} |")
-        print(f"| Total Trade Fees | {format_number(cumulative.get('trade_fee'), prefix='$')} |")
-        print(f"| Total Protocol Fees | {format_number(cumulative.get('protocol_fee'), prefix='$')} |")
+        out.append("\n### Cumulative Metrics (All Time)\n")
+        out.append("| Metric | Value |")
+        out.append("|--------|-------|")
+        out.append(f"| Total Volume | {format_number(cumulative.get('volume'), prefix='$')} |")
+        out.append(f"| Total Trade Fees | {format_number(cumulative.get('trade_fee'), prefix='$')} |")
+        out.append(f"| Total Protocol Fees | {format_number(cumulative.get('protocol_fee'), prefix='$')} |")
 
     # Liquidity Distribution from Gateway
     if gateway and gateway.get("bins"):
         # Show Gateway price (real-time) vs Meteora price
         gateway_price = gateway.get("price")
         if gateway_price:
-            print("\n### Real-Time Price (from Gateway)\n")
-            print(f"**{format_price_subscript(gateway_price)} {token_y.get('symbol', '')}/{token_x.get('symbol', '')}**")
+            out.append("\n### Real-Time Price (from Gateway)\n")
+            out.append(f"**{format_price_subscript(gateway_price)} {token_y.get('symbol', '')}/{token_x.get('symbol', '')}**")
 
-        print("\n### Liquidity Distribution\n")
-        print("```")
+        out.append("\n### Liquidity Distribution\n")
+        out.append("```")
         chart = render_liquidity_chart(
             gateway.get("bins", []),
             gateway.get("activeBinId", 0),
@@ -333,23 +389,25 @@ def print_summary_table(pool: dict, gateway: dict = None, gateway_error: str = N
             base_symbol=token_x.get("symbol", ""),
             quote_symbol=token_y.get("symbol", ""),
         )
-        print(chart)
-        print("```")
+        out.append(chart)
+        out.append("```")
 
         # Gateway-specific info
-        print("\n### Active Bin Info\n")
-        print("| Metric | Value |")
-        print("|--------|-------|")
-        print(f"| Active Bin ID | {gateway.get('activeBinId', '—')} |")
-        print(f"| Min Bin ID | {gateway.get('minBinId', '—')} |")
-        print(f"| Max Bin ID | {gateway.get('maxBinId', '—')} |")
-        print(f"| Dynamic Fee | {format_percent(gateway.get('dynamicFeePct'))} |")
+        out.append("\n### Active Bin Info\n")
+        out.append("| Metric | Value |")
+        out.append("|--------|-------|")
+        out.append(f"| Active Bin ID | {gateway.get('activeBinId', '—')} |")
+        out.append(f"| Min Bin ID | {gateway.get('minBinId', '—')} |")
+        out.append(f"| Max Bin ID | {gateway.get('maxBinId', '—')} |")
+        out.append(f"| Dynamic Fee | {format_percent(gateway.get('dynamicFeePct'))} |")
     else:
-        print("\n### Liquidity Distribution\n")
+        out.append("\n### Liquidity Distribution\n")
         if gateway_error:
-            print(f"*{gateway_error}*")
+            out.append(f"*{gateway_error}*")
         else:
-            print("*Gateway not available - run with Gateway for bin distribution*")
+            out.append("*Gateway not available - run with Gateway for bin distribution*")
+
+    write_out("\n".join(out))
 
 
 def print_json(pool: dict, gateway: dict = None):
@@ -359,7 +417,7 @@ def print_json(pool: dict, gateway: dict = None):
     }
     if gateway:
         output["gateway"] = gateway
-    print(json.dumps(output, indent=2))
+    write_out(json.dumps(output, indent=2))
 
 
 def main():
@@ -372,8 +430,9 @@ Examples:
   %(prog)s BGm1tav58oGcsQJehL9WXBFXF7D27vZsKefj4xJKD5Y --json
 
 Environment variables:
-  GATEWAY_HOST  Gateway host (default: localhost)
-  GATEWAY_PORT  Gateway port (default: 15888)
+  GATEWAY_HOST       Gateway host (default: localhost)
+  GATEWAY_PORT       Gateway port (default: 15888)
+  METEORA_CACHE_TTL  Seconds to reuse cached Meteora responses (default: 15, 0 disables)
         """,
     )
     parser.add_argument(
@@ -393,15 +452,24 @@ Environment variables:
 
     args = parser.parse_args()
 
+    if not _ADDRESS_RE.fullmatch(args.address):
+        parser.error(f"invalid pool address: {args.address}")
+
+    from concurrent.futures import ThreadPoolExecutor
+
     try:
-        # Fetch from Meteora API
-        pool = fetch_pool_meteora(args.address)
-
-        # Fetch from Gateway API (optional)
-        gateway = None
-        gateway_error = None
-        if not args.no_gateway:
-            gateway, gateway_error = fetch_pool_gateway(args.address)
+        # Meteora and Gateway are independent — fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as pool_ex:
+            gateway_future = None
+            if not args.no_gateway:
+                gateway_future = pool_ex.submit(fetch_pool_gateway, args.address)
+            pool = fetch_pool_meteora(args.address)
+
+            # Gateway API is optional
+            gateway = None
+            gateway_error = None
+            if gateway_future:
+                gateway, gateway_error = gateway_future.result()
 
         if args.json:
             print_json(pool, gateway)
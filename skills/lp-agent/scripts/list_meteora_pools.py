@@ -15,7 +15,12 @@ Examples:
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import os
+import sys
+import time
 import urllib.request
 import urllib.parse
 
@@ -24,6 +29,42 @@ API_BASE = "https://dlmm.datapi.meteora.ag"
 # Default number of results
 DEFAULT_LIMIT = 10
 
+# On-disk cache for Meteora API responses (override TTL with METEORA_CACHE_TTL, 0 disables)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hummingbot-skills", "meteora")
+DEFAULT_CACHE_TTL = 15
+
+
+# Scripts here are standalone, so _cached_get is duplicated: keep it identical to get_meteora_pool.py
+def _cached_get(url: str, headers: dict, timeout: int = 30) -> bytes:
+    """GET url, reusing a response cached on disk for METEORA_CACHE_TTL seconds (0 disables)."""
+    try:
+        ttl = float(os.environ.get("METEORA_CACHE_TTL", DEFAULT_CACHE_TTL))
+    except ValueError:
+        ttl = DEFAULT_CACHE_TTL
+    path = os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + ".json")
+    if ttl > 0:
+        try:
+            if time.time() - os.path.getmtime(path) < ttl:
+                with open(path, "rb") as f:
+                    return f.read()
+        except OSError:
+            pass
+
+    req = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        body = resp.read()
+
+    if ttl > 0:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return body
+
 
 def fetch_pools(
     query: str = None,
@@ -54,32 +95,48 @@ def fetch_pools(
 
     url = f"{API_BASE}/pools?{urllib.parse.urlencode(params)}"
 
-    req = urllib.request.Request(url, headers={
+    return json.loads(_cached_get(url, headers={
         "Accept": "application/json",
         "User-Agent": "Mozilla/5.0 (compatible; hummingbot-skills/1.0)",
-    })
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read().decode())
+    }))
+
+
+def _memoize(fn):
+    """lru_cache fn, calling it directly when an argument is unhashable."""
+    cached = functools.lru_cache(maxsize=512)(fn)
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        try:
+            return cached(*args, **kwargs)
+        except TypeError:
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+# (divisor, letter) pairs, largest first
+_SUFFIXES = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
 
 
+@_memoize
 def format_number(value, decimals=2, prefix="", suffix=""):
     """Format number with K/M/B suffixes."""
     if value is None:
         return "—"
-    try:
-        num = float(value)
-        if num >= 1_000_000_000:
-            return f"{prefix}{num/1_000_000_000:.{decimals}f}B{suffix}"
-        elif num >= 1_000_000:
-            return f"{prefix}{num/1_000_000:.{decimals}f}M{suffix}"
-        elif num >= 1_000:
-            return f"{prefix}{num/1_000:.{decimals}f}K{suffix}"
-        else:
-            return f"{prefix}{num:.{decimals}f}{suffix}"
-    except (ValueError, TypeError):
-        return "—"
-
-
+    if isinstance(value, (int, float)):
+        num = value
+    else:
+        try:
+            num = float(value)
+        except (ValueError, TypeError):
+            return "—"
+    for divisor, letter in _SUFFIXES:
+        if num >= divisor:
+            return f"{prefix}{num/divisor:.{decimals}f}{letter}{suffix}"
+    return f"{prefix}{num:.{decimals}f}{suffix}"
+
+
+@_memoize
 def format_percent(value):
     """Format as percentage."""
     if value is None:
@@ -90,11 +147,17 @@ def format_percent(value):
         return "—"
 
 
+@_memoize
 def short_address(address: str, chars: int = 4) -> str:
     """Shorten address to first and last N characters."""
-    if not address or len(address) <= chars * 2 + 2:
-        return address or "—"
-    return f"{address[:chars]}..{address[-chars:]}"
+    return f"{address[:chars]}..{address[-chars:]}" if address and len(address) > chars * 2 + 2 else (address or "—")
+
+
+def write_out(text: str):
+    """Write text plus newline to stdout as one pre-encoded UTF-8 write."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write((text + "\n").encode("utf-8"))
+    sys.stdout.buffer.flush()
 
 
 def print_markdown_table(data: dict, sort_by: str):
@@ -108,11 +171,12 @@ def print_markdown_table(data: dict, sort_by: str):
         print("No pools found.")
         return
 
-    print(f"Found {total} pools (showing page {page}/{pages}, sorted by {sort_by})\n")
+    out = []
+    out.append(f"Found {total} pools (showing page {page}/{pages}, sorted by {sort_by})\n")
 
     # Markdown table header
-    print("| # | Pool | Pool Address | Base (mint) | Quote (mint) | TVL | Vol 24h | Fees 24h | APR | Fee | Bin |")
-    print("|---|------|--------------|-------------|--------------|-----|---------|----------|-----|-----|-----|")
+    out.append("| # | Pool | Pool Address | Base (mint) | Quote (mint) | TVL | Vol 24h | Fees 24h | APR | Fee | Bin |")
+    out.append("|---|------|--------------|-------------|--------------|-----|---------|----------|-----|-----|-----|")
 
     for i, pool in enumerate(pools, 1):
         name = pool.get("name", "Unknown")
@@ -131,9 +195,10 @@ def print_markdown_table(data: dict, sort_by: str):
         fee_tier = format_percent(pool_config.get("base_fee_pct"))
         bin_step = pool_config.get("bin_step", "—")
 
-        print(f"| {i} | {name} | `{short_address(address, 6)}` | {base_symbol} (`{base_mint}`) | {quote_symbol} (`{quote_mint}`) | {tvl} | {volume} | {fees} | {apr} | {fee_tier} | {bin_step} |")
+        out.append(f"| {i} | {name} | `{short_address(address, 6)}` | {base_symbol} (`{base_mint}`) | {quote_symbol} (`{quote_mint}`) | {tvl} | {volume} | {fees} | {apr} | {fee_tier} | {bin_step} |")
 
-    print(f"\nUse `get_meteora_pool.py <pool_address>` for detailed pool info including full token mints.")
+    out.append(f"\nUse `get_meteora_pool.py <pool_address>` for detailed pool info including full token mints.")
+    write_out("\n".join(out))
 
 
 def print_json(data: dict):
@@ -166,7 +231,7 @@ def print_json(data: dict):
         "pages": data.get("pages"),
         "pools": result,
     }
-    print(json.dumps(output, indent=2))
+    write_out(json.dumps(output, indent=2))
 
 
 def main():
@@ -180,6 +245,9 @@ Examples:
   %(prog)s --query USDC --sort tvl      # USDC pools sorted by TVL
   %(prog)s --sort apr --limit 20        # Top 20 by APR
   %(prog)s --query <address>            # Search by pool address
+
+Environment variables:
+  METEORA_CACHE_TTL  Seconds to reuse cached Meteora responses (default: 15, 0 disables)
         """,
     )
     parser.add_argument(
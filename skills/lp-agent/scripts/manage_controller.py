@@ -24,74 +24,329 @@ Usage:
     # Stop a bot
     python manage_controller.py stop my_bot
 
+    # Stop several bots at once
+    python manage_controller.py stop-bots bot_a bot_b bot_c
+
+    # Create many configs from a JSONL file (one config object per line)
+    python manage_controller.py create-configs-batch configs.jsonl --concurrency 4
+
+    # Run several subcommands (one per stdin line) concurrently in one process
+    printf 'bot-status bot_a\nbot-status bot_b\n' | python manage_controller.py batch
+
+Importing this module and calling api_request() or the command handlers directly shares
+its keep-alive connections across calls; they are closed when the interpreter exits.
+
 Environment:
     HUMMINGBOT_API_URL - API base URL (default: http://localhost:8000)
     API_USER - API username (default: admin)
     API_PASS - API password (default: admin)
+    HUMMINGBOT_API_CACHE - Set to 0 to disable the short-lived GET response cache
 """
 
 import argparse
+import atexit
+import functools
+import gzip
+import hashlib
+import http.client
 import json
 import os
+import re
+import select
 import sys
-import urllib.request
-import urllib.error
+import threading
+import time
+import urllib.parse
 import base64
 
+# Keep-alive connections per (scheme, host:port), reused by every api_request call.
+# Thread-local so batch workers each get their own socket.
+_LOCAL = threading.local()
+# Every open pooled connection, across threads, so they can all be closed at exit
+_OPEN_CONNECTIONS = set()
+
+# Idempotent requests are retried on connection failures with exponential backoff
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.2
+_TIMEOUT = 30
+
+# Redirects followed for GET/HEAD, as urllib did (e.g. FastAPI's trailing-slash 307)
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+# On-disk cache for read-only GETs: seconds a response may be reused per endpoint prefix
+# (longest prefix wins). Any write request clears it; HUMMINGBOT_API_CACHE=0 disables it.
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "hummingbot-skills", "api")
+_CACHE_TTLS = {
+    "/controllers/generic/lp_rebalancer/config/template": 300,
+    "/controllers/configs/": 10,
+    "/bot-orchestration/": 5,
+}
+
+
+_ENV_LOADED = False
+
+# Only the .env keys this script reads; other lines are never matched or copied into os.environ
+_ENV_KEYS = ("HUMMINGBOT_API_URL", "API_USER", "API_PASS", "HUMMINGBOT_API_CACHE")
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*(" + "|".join(_ENV_KEYS) + r")[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE
+)
+
 
 def load_env():
-    """Load environment from .env files."""
+    """Load environment from .env files (once per process)."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     for path in ["hummingbot-api/.env", os.path.expanduser("~/.hummingbot/.env"), ".env"]:
         if os.path.exists(path):
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+                text = f.read()
+            for key, value in _ENV_LINE_RE.findall(text):
+                os.environ.setdefault(key, value.strip('"').strip("'"))
             break
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_config():
-    """Get API configuration from environment."""
+    """Get API configuration from environment (memoized per process)."""
     load_env()
-    return {
+    config = {
         "url": os.environ.get("HUMMINGBOT_API_URL", "http://localhost:8000"),
         "user": os.environ.get("API_USER", "admin"),
         "password": os.environ.get("API_PASS", "admin"),
     }
+    # Basic auth header, encoded once alongside the memoized config
+    credentials = base64.b64encode(f"{config['user']}:{config['password']}".encode()).decode()
+    config["auth_header"] = f"Basic {credentials}"
+    return config
 
 
-def api_request(method: str, endpoint: str, data=None) -> dict:
-    """Make authenticated API request."""
+def _cache_ttl(endpoint: str) -> float:
+    """Seconds a cached GET of endpoint stays fresh (0 = not cached)."""
+    if os.environ.get("HUMMINGBOT_API_CACHE", "1") == "0":
+        return 0
+    prefixes = [prefix for prefix in _CACHE_TTLS if endpoint.startswith(prefix)]
+    return _CACHE_TTLS[max(prefixes, key=len)] if prefixes else 0
+
+
+def _cache_path(endpoint: str) -> str:
     config = get_api_config()
-    url = f"{config['url']}{endpoint}"
+    key = f"{config['url']}|{config['user']}|{endpoint}"
+    return os.path.join(CACHE_DIR, hashlib.sha1(key.encode()).hexdigest() + ".json")
 
-    # Basic auth
-    credentials = base64.b64encode(f"{config['user']}:{config['password']}".encode()).decode()
-    headers = {
-        "Authorization": f"Basic {credentials}",
-        "Content-Type": "application/json",
-    }
 
-    body = json.dumps(data).encode() if data else None
-    req = urllib.request.Request(url, data=body, headers=headers, method=method)
+def _cache_read(path: str, ttl: float = None):
+    """Cached body at path, or None if missing or older than ttl (None = any age)."""
+    try:
+        if ttl is not None and time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _cache_write(path: str, raw: bytes):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
 
+def _cache_clear():
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
-        print(f"Error: HTTP {e.code} - {e.reason}", file=sys.stderr)
-        if error_body:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        if name.endswith(".json"):
             try:
-                print(json.dumps(json.loads(error_body), indent=2), file=sys.stderr)
-            except json.JSONDecodeError:
-                print(error_body, file=sys.stderr)
+                os.remove(os.path.join(CACHE_DIR, name))
+            except OSError:
+                pass
+
+
+def api_request(method: str, endpoint: str, data=None) -> dict:
+    """Make authenticated API request (read-only GETs are served from a short-lived cache)."""
+    config = get_api_config()
+    ttl = _cache_ttl(endpoint) if method == "GET" else 0
+    if ttl:
+        path = _cache_path(endpoint)
+        cached = _cache_read(path, ttl)
+        if cached is not None:
+            return json.loads(cached)
+
+    try:
+        status, reason, raw = _api_call(method, endpoint, data)
+    except (OSError, http.client.HTTPException) as e:
+        stale = _cache_read(path) if ttl else None
+        if stale is not None:
+            print(f"Warning: Cannot connect to API at {config['url']}: {e} (showing cached response)", file=sys.stderr)
+            return json.loads(stale)
+        print(f"Error: Cannot connect to API at {config['url']}: {e}", file=sys.stderr)
         sys.exit(1)
-    except urllib.error.URLError as e:
-        print(f"Error: Cannot connect to API at {config['url']}: {e.reason}", file=sys.stderr)
+
+    if status >= 300:
+        print(f"Error: HTTP {status} - {reason}", file=sys.stderr)
+        # Only bodies that look like JSON are worth a parse + re-indent; print anything else as-is
+        pretty = None
+        if raw.lstrip()[:1] in (b"{", b"["):
+            try:
+                pretty = json.dumps(json.loads(raw), indent=2)
+            except ValueError:
+                pass
+        if raw:
+            print(pretty or raw.decode(errors="replace"), file=sys.stderr)
+        sys.exit(1)
+    try:
+        result = json.loads(raw) if raw else {}
+    except ValueError:
+        print(f"Error: Invalid JSON response from API: {raw[:200].decode(errors='replace')}", file=sys.stderr)
         sys.exit(1)
+    if ttl:
+        _cache_write(path, raw)
+    return result
+
+
+def _api_call(method: str, endpoint: str, data=None) -> tuple:
+    """Send an authenticated request; returns (status, reason, body bytes) without exiting on errors."""
+    config = get_api_config()
+    url = f"{config['url']}{endpoint}"
+    headers = {
+        "Authorization": config["auth_header"],
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip",
+    }
+
+    # Compact separators: the API doesn't need whitespace in request bodies
+    body = json.dumps(data, separators=(",", ":")).encode() if data else None
+    if method == "GET":
+        return _send(method, url, body, headers)
+    # Writes may change anything a cached GET returned. Clear before and after: a concurrent
+    # GET (e.g. another batch line) can re-cache pre-write data while the write is in flight.
+    _cache_clear()
+    try:
+        return _send(method, url, body, headers)
+    finally:
+        _cache_clear()
+
+
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme: str, netloc: str):
+    """(proxy host:port, Proxy-Authorization value or None) for scheme://netloc, or None to connect directly.
+
+    Follows urllib's reading of the http_proxy/https_proxy/no_proxy environment variables.
+    """
+    if not any(name.lower() == f"{scheme}_proxy" for name in os.environ):
+        return None
+    import urllib.request  # only needed once a proxy is configured
+
+    proxy = urllib.request.getproxies_environment().get(scheme)
+    if not proxy or urllib.request.proxy_bypass_environment(netloc):
+        return None
+    proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    auth = None
+    if proxy_parts.username:
+        credentials = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+        auth = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+    return proxy_parts.netloc.rpartition("@")[2], auth
+
+
+def _open_connection(scheme: str, netloc: str, proxy):
+    """New keep-alive connection to netloc, or to the proxy (HTTPS tunnels through it with CONNECT)."""
+    conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    if proxy is None:
+        return conn_cls(netloc, timeout=_TIMEOUT)
+    proxy_netloc, proxy_auth = proxy
+    conn = conn_cls(proxy_netloc, timeout=_TIMEOUT)
+    if scheme == "https":
+        conn.set_tunnel(netloc, headers={"Proxy-Authorization": proxy_auth} if proxy_auth else None)
+    return conn
+
+
+def _connection_dropped(conn) -> bool:
+    """True if an idle pooled socket is readable, i.e. the server closed it (or sent stray data)."""
+    return bool(select.select([conn.sock], [], [], 0)[0])
+
+
+def _send(method: str, url: str, body, headers: dict, redirects: int = 0) -> tuple:
+    """Send a request over the pooled connection for url's host; returns (status, reason, decoded body bytes)."""
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or "/")
+    key = (parts.scheme, parts.netloc)
+    connections = _LOCAL.__dict__.setdefault("connections", {})
+    proxy = _proxy_for(parts.scheme, parts.netloc)
+    request_headers = headers
+    if proxy is not None and parts.scheme == "http":
+        # A plain-HTTP proxy takes the absolute URL as the request target
+        path = urllib.parse.urlunsplit(parts._replace(fragment=""))
+        if proxy[1]:
+            request_headers = {**headers, "Proxy-Authorization": proxy[1]}
+
+    retries = _MAX_RETRIES if method in _IDEMPOTENT_METHODS else 0
+    attempt = 0
+    reconnected = False
+    while True:
+        conn = connections.get(key)
+        if conn is None:
+            conn = connections[key] = _open_connection(parts.scheme, parts.netloc, proxy)
+            _OPEN_CONNECTIONS.add(conn)
+        elif conn.sock is not None and _connection_dropped(conn):
+            # Stale keep-alive socket: send on a fresh one rather than risk a non-idempotent resend
+            conn.close()
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=body, headers=request_headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+            break
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            connections.pop(key, None)
+            _OPEN_CONNECTIONS.discard(conn)
+            if not isinstance(e, ConnectionError) or method not in _IDEMPOTENT_METHODS:
+                raise
+            if reused and not reconnected:
+                # The server closed an idle keep-alive socket — reconnect once right away
+                reconnected = True
+                continue
+            if attempt >= retries:
+                raise
+            time.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+            attempt += 1
+
+    if resp.getheader("Content-Encoding") == "gzip":
+        raw = gzip.decompress(raw)
+    location = resp.getheader("Location")
+    if resp.status in _REDIRECT_STATUSES and location and method in ("GET", "HEAD") and redirects < _MAX_REDIRECTS:
+        target = urllib.parse.urljoin(url, location)
+        if urllib.parse.urlsplit(target)[:2] != parts[:2]:
+            # Never hand the API credentials to another origin
+            headers = {name: value for name, value in headers.items() if name != "Authorization"}
+        return _send(method, target, body, headers, redirects + 1)
+    return resp.status, resp.reason, raw
+
+
+@atexit.register
+def close_connections():
+    """Close every pooled keep-alive connection (registered to run at interpreter exit)."""
+    while _OPEN_CONNECTIONS:
+        _OPEN_CONNECTIONS.pop().close()
+    _LOCAL.__dict__.pop("connections", None)
+
+
+def json_out(obj) -> str:
+    """--json rendering: indented for a terminal, compact when piped to another program."""
+    if sys.stdout.isatty():
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
 
 
 def get_template(args):
@@ -99,7 +354,7 @@ def get_template(args):
     result = api_request("GET", "/controllers/generic/lp_rebalancer/config/template")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         print("LP Rebalancer Config Template")
         print("-" * 50)
@@ -111,8 +366,38 @@ def get_template(args):
             print(f"  {field}: {default} [{field_type}]{req_str}")
 
 
+def _validate_create_config(args) -> list:
+    """Check create-config arguments locally; returns a list of problems (empty if valid)."""
+    errors = []
+    if args.amount <= 0:
+        errors.append("--amount must be greater than 0")
+    if not 0 < args.width <= 100:
+        errors.append("--width must be between 0 and 100 (pct)")
+    if args.offset < 0:
+        errors.append("--offset must not be negative")
+    if args.rebalance_seconds < 0:
+        errors.append("--rebalance-seconds must not be negative")
+    if args.rebalance_threshold < 0:
+        errors.append("--rebalance-threshold must not be negative")
+    for flag in ("sell_max", "sell_min", "buy_max", "buy_min"):
+        value = getattr(args, flag)
+        if value is not None and value <= 0:
+            errors.append(f"--{flag.replace('_', '-')} must be greater than 0")
+    for side in ("sell", "buy"):
+        low, high = getattr(args, f"{side}_min"), getattr(args, f"{side}_max")
+        if low is not None and high is not None and low > high:
+            errors.append(f"--{side}-min ({low}) is greater than --{side}-max ({high})")
+    return errors
+
+
 def create_config(args):
     """Create LP Rebalancer controller config."""
+    errors = _validate_create_config(args)
+    if errors:
+        for error in errors:
+            print(f"Error: {error}", file=sys.stderr)
+        sys.exit(1)
+
     config_data = {
         "id": args.config_name,
         "controller_name": "lp_rebalancer",
@@ -130,17 +415,24 @@ def create_config(args):
         "strategy_type": args.strategy_type,
     }
 
-    # Add price limits
-    config_data["sell_price_max"] = args.sell_max
-    config_data["sell_price_min"] = args.sell_min
-    config_data["buy_price_max"] = args.buy_max
-    config_data["buy_price_min"] = args.buy_min
+    # Add price limits; unset ones are omitted so the controller default (no limit) applies
+    limits = {
+        "sell_price_max": args.sell_max,
+        "sell_price_min": args.sell_min,
+        "buy_price_max": args.buy_max,
+        "buy_price_min": args.buy_min,
+    }
+    config_data.update((key, value) for key, value in limits.items() if value is not None)
+
+    if args.dry_run:
+        print(json_out(config_data))
+        return
 
     # POST /controllers/configs/{config_name} to create/update
     result = api_request("POST", f"/controllers/configs/{args.config_name}", config_data)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         print(f"✓ Config '{args.config_name}' created")
         print(f"  Pool: {args.pool}")
@@ -148,28 +440,87 @@ def create_config(args):
         print(f"  Amount: {args.amount} (quote)")
 
 
+def create_configs_batch(args):
+    """Create controller configs from a JSONL file, reusing keep-alive connections."""
+    # Only the concurrent commands need a thread pool; importing it pulls in logging
+    from concurrent.futures import ThreadPoolExecutor
+
+    try:
+        with open(args.file) as f:
+            lines = f.readlines()
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Error: Cannot read {args.file}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    entries = []
+    for lineno, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        # (line number, parsed config, parse error) — the error slot keeps a JSON string line
+        # like "foo" distinct from a line that failed to parse
+        try:
+            entries.append((lineno, json.loads(line), None))
+        except json.JSONDecodeError as e:
+            entries.append((lineno, None, f"invalid JSON: {e}"))
+
+    def create_one(entry):
+        lineno, cfg, parse_error = entry
+        if parse_error or not isinstance(cfg, dict) or not cfg.get("id"):
+            error = parse_error or 'expected a JSON object with an "id"'
+            return {"line": lineno, "id": None, "ok": False, "error": error}
+        try:
+            status, reason, raw = _api_call("POST", f"/controllers/configs/{cfg['id']}", cfg)
+        except (OSError, http.client.HTTPException) as e:
+            return {"line": lineno, "id": cfg["id"], "ok": False, "error": str(e)}
+        if status >= 300:
+            return {"line": lineno, "id": cfg["id"], "ok": False,
+                    "error": f"HTTP {status} - {reason}: {raw.decode(errors='replace')}"}
+        try:
+            result = json.loads(raw) if raw else None
+        except ValueError:
+            return {"line": lineno, "id": cfg["id"], "ok": False, "error": "invalid JSON response"}
+        return {"line": lineno, "id": cfg["id"], "ok": True, "result": result}
+
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        results = list(pool.map(create_one, entries))
+
+    failed = sum(1 for r in results if not r["ok"])
+    if args.json:
+        print(json_out(results))
+    else:
+        for r in results:
+            if r["ok"]:
+                print(f"✓ Config '{r['id']}' created")
+            else:
+                print(f"✗ Line {r['line']} ({r['id'] or '?'}): {r['error']}")
+        print(f"\nCreated {len(results) - failed} of {len(results)} configs")
+    if failed:
+        sys.exit(1)
+
+
 def list_configs(args):
     """List all controller configs."""
     result = api_request("GET", "/controllers/configs/")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if not result:
             print("No configs found.")
             return
 
-        print(f"Controller Configs ({len(result)}):")
-        print("-" * 80)
-        print(f"{'Name':<25} {'Controller':<20} {'Pair':<15} {'Amount'}")
-        print("-" * 80)
-
-        for cfg in result:
-            name = cfg.get("id", "")[:23]
-            controller = cfg.get("controller_name", "")[:18]
-            pair = cfg.get("trading_pair", "")[:13]
-            amount = cfg.get("total_amount_quote", "")
-            print(f"{name:<25} {controller:<20} {pair:<15} {amount}")
+        lines = [
+            f"Controller Configs ({len(result)}):",
+            "-" * 80,
+            f"{'Name':<25} {'Controller':<20} {'Pair':<15} {'Amount'}",
+            "-" * 80,
+        ]
+        # Width.precision pads and truncates in one format call per field
+        row = "{id:<25.23} {controller_name:<20.18} {trading_pair:<15.13} {total_amount_quote}".format_map
+        blank = {"id": "", "controller_name": "", "trading_pair": "", "total_amount_quote": ""}
+        lines.extend(row({**blank, **cfg}) for cfg in result)
+        print("\n".join(lines))
 
 
 def describe_config(args):
@@ -177,7 +528,7 @@ def describe_config(args):
     result = api_request("GET", f"/controllers/configs/{args.config_name}")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         print(f"Config: {args.config_name}")
         print("-" * 50)
@@ -191,7 +542,7 @@ def delete_config(args):
     result = api_request("DELETE", f"/controllers/configs/{args.config_name}")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         print(f"✓ Config '{args.config_name}' deleted")
 
@@ -216,7 +567,7 @@ def deploy_bot(args):
     result = api_request("POST", "/bot-orchestration/deploy-v2-controllers", data)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if result.get("success"):
             print(f"✓ Bot deployed")
@@ -232,19 +583,18 @@ def get_status(args):
     result = api_request("GET", "/bot-orchestration/status")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         data = result.get("data", result)
         if not data:
             print("No active bots.")
             return
 
-        print("Active Bots:")
-        print("-" * 60)
+        lines = ["Active Bots:", "-" * 60]
 
         for bot_name, bot_data in data.items():
             status = bot_data.get("status", "unknown")
-            print(f"\n{bot_name} ({status})")
+            lines.append(f"\n{bot_name} ({status})")
 
             # Performance data if available
             perf = bot_data.get("performance", {})
@@ -252,9 +602,10 @@ def get_status(args):
                 pnl = perf.get("unrealized_pnl_quote", 0)
                 rpnl = perf.get("realized_pnl_quote", 0)
                 volume = perf.get("volume_traded", 0)
-                print(f"  Unrealized PnL: ${pnl:.2f}")
-                print(f"  Realized PnL: ${rpnl:.2f}")
-                print(f"  Volume: ${volume:.2f}")
+                lines.append(f"  Unrealized PnL: ${pnl:.2f}")
+                lines.append(f"  Realized PnL: ${rpnl:.2f}")
+                lines.append(f"  Volume: ${volume:.2f}")
+        print("\n".join(lines))
 
 
 def get_bot_status(args):
@@ -262,7 +613,7 @@ def get_bot_status(args):
     result = api_request("GET", f"/bot-orchestration/{args.bot_name}/status")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         data = result.get("data", result)
         print(f"Bot: {args.bot_name}")
@@ -286,7 +637,7 @@ def stop_bot(args):
     result = api_request("POST", "/bot-orchestration/stop-bot", data)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         response = result.get("response", result)
         if response.get("success"):
@@ -295,25 +646,68 @@ def stop_bot(args):
             print(f"Response: {response}")
 
 
+def stop_bots(args):
+    """Stop several bots concurrently, reusing keep-alive connections."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    def stop_one(bot_name):
+        data = {
+            "bot_name": bot_name,
+            "skip_order_cancellation": args.skip_cancel,
+            "async_backend": True,
+        }
+        try:
+            status, reason, raw = _api_call("POST", "/bot-orchestration/stop-bot", data)
+        except (OSError, http.client.HTTPException) as e:
+            return {"error": str(e)}
+        if status >= 300:
+            return {"error": f"HTTP {status} - {reason}: {raw.decode(errors='replace')}"}
+        if not raw:
+            return {}
+        try:
+            result = json.loads(raw)
+        except ValueError:
+            return {"error": f"invalid JSON response: {raw[:200].decode(errors='replace')}"}
+        if not isinstance(result, dict):
+            return {"error": f"unexpected response: {json.dumps(result)[:200]}"}
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        results = dict(zip(args.bot_names, pool.map(stop_one, args.bot_names)))
+
+    def stopped(result):
+        response = result.get("response", result)
+        return isinstance(response, dict) and bool(response.get("success"))
+
+    failed = sum(1 for result in results.values() if not stopped(result))
+    if args.json:
+        print(json_out(results))
+    else:
+        for bot_name, result in results.items():
+            if stopped(result):
+                print(f"✓ Bot '{bot_name}' stopped")
+            else:
+                print(f"✗ Bot '{bot_name}': {result.get('error') or result.get('response', result)}")
+        print(f"\nStopped {len(results) - failed} of {len(results)} bots")
+    if failed:
+        sys.exit(1)
+
+
 def stop_and_archive(args):
     """Stop and archive a bot."""
-    endpoint = f"/bot-orchestration/stop-and-archive-bot/{args.bot_name}"
-    params = []
-    if args.skip_cancel:
-        params.append("skip_order_cancellation=true")
+    query = {"skip_order_cancellation": "true"} if args.skip_cancel else {}
     if args.s3_bucket:
-        params.append(f"s3_bucket={args.s3_bucket}")
-        params.append("archive_locally=false")
+        query["s3_bucket"] = args.s3_bucket
+        query["archive_locally"] = "false"
     else:
-        params.append("archive_locally=true")
+        query["archive_locally"] = "true"
 
-    if params:
-        endpoint += "?" + "&".join(params)
+    endpoint = f"/bot-orchestration/stop-and-archive-bot/{args.bot_name}?{urllib.parse.urlencode(query)}"
 
     result = api_request("POST", endpoint)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if result.get("status") == "success":
             print(f"✓ Stop and archive initiated for '{args.bot_name}'")
@@ -322,93 +716,182 @@ def stop_and_archive(args):
             print(f"Response: {result}")
 
 
-def main():
+class _ThreadLocalStream:
+    """Stream proxy that sends writes from batch workers to their own buffer."""
+
+    def __init__(self, stream, index: int):
+        self._stream = stream
+        self._index = index
+
+    def write(self, text):
+        buffers = getattr(_LOCAL, "buffers", None)
+        return (buffers[self._index] if buffers else self._stream).write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def run_batch(args):
+    """Run subcommands read from stdin (one per line) concurrently over keep-alive connections."""
+    import io
+    import shlex
+    from concurrent.futures import ThreadPoolExecutor
+
+    lines = [line.strip() for line in sys.stdin]
+    lines = [line for line in lines if line and not line.startswith("#")]
+    parser = build_parser()
+
+    def run_one(line):
+        out, err = io.StringIO(), io.StringIO()
+        _LOCAL.buffers = (out, err)
+        code = 0
+        try:
+            sub_args = parser.parse_args(shlex.split(line))
+            if sub_args.func is run_batch:
+                parser.error("batch cannot be nested")
+            sub_args.func(sub_args)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            if isinstance(e.code, str):
+                err.write(e.code + "\n")
+        except Exception as e:
+            # One failing line (unreadable file, dropped connection, ...) must not sink the batch
+            print(f"Error: {e}", file=sys.stderr)
+            code = 1
+        finally:
+            _LOCAL.buffers = None
+        return code, out.getvalue(), err.getvalue()
+
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = _ThreadLocalStream(stdout, 0), _ThreadLocalStream(stderr, 1)
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+            results = list(pool.map(run_one, lines))
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+
+    # Output is printed in input order, as if the commands had run one after another
+    for code, out, err in results:
+        stdout.write(out)
+        stderr.write(err)
+    if any(code for code, _, _ in results):
+        sys.exit(1)
+
+
+def _add_json_arg(parser):
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+
+def _add_create_config_args(parser):
+    parser.add_argument("config_name", help="Config name")
+    parser.add_argument("--pool", required=True, help="Pool address (from Meteora UI or list_meteora_pools.py)")
+    parser.add_argument("--pair", required=True, help="Trading pair matching pool tokens (e.g., SOL-USDC, Percolator-SOL). Use exact token symbols from Gateway.")
+    parser.add_argument("--connector", default="meteora/clmm", help="Connector name")
+    parser.add_argument("--network", default="solana-mainnet-beta", help="Network")
+    parser.add_argument("--amount", type=float, required=True, help="Total amount in QUOTE asset (2nd token in pair). E.g. for Percolator-SOL this is SOL. For SOL-USDC this is USDC.")
+    parser.add_argument("--side", type=int, default=0, choices=[0, 1, 2], help="Side: 0=BOTH, 1=BUY (quote only), 2=SELL (base only)")
+    parser.add_argument("--width", type=float, default=10.0, help="Position width in pct (e.g. 10 = 10%% of current price above and below)")
+    parser.add_argument("--offset", type=float, default=0.1, help="Position offset in pct — how far center of range is from current price (default: 0.1%%)")
+    parser.add_argument("--rebalance-seconds", type=int, default=300, help="Seconds out-of-range before rebalancing (default: 300)")
+    parser.add_argument("--rebalance-threshold", type=float, default=1.0, help="Rebalance threshold in pct — minimum price movement to trigger rebalance (default: 1.0)")
+    parser.add_argument("--sell-max", type=float, default=None, help="Max price for SELL orders (default: null = no limit)")
+    parser.add_argument("--sell-min", type=float, default=None, help="Min price for SELL orders (default: null = no limit)")
+    parser.add_argument("--buy-max", type=float, default=None, help="Max price for BUY orders (default: null = no limit)")
+    parser.add_argument("--buy-min", type=float, default=None, help="Min price for BUY orders (default: null = no limit)")
+    parser.add_argument("--strategy-type", type=int, default=0, choices=[0, 1, 2], help="Meteora liquidity shape: 0=Spot (uniform), 1=Curve (concentrated center), 2=Bid-Ask (edges)")
+    parser.add_argument("--dry-run", action="store_true", help="Validate and print the config payload without creating it")
+    _add_json_arg(parser)
+
+
+def _add_create_configs_batch_args(parser):
+    parser.add_argument("file", help="JSONL file with one controller config object (including \"id\") per line")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel requests (default: 4)")
+    _add_json_arg(parser)
+
+
+def _add_batch_args(parser):
+    parser.add_argument("--concurrency", type=int, default=4, help="Commands run in parallel (default: 4)")
+
+
+def _add_config_name_args(parser):
+    parser.add_argument("config_name", help="Config name")
+    _add_json_arg(parser)
+
+
+def _add_deploy_args(parser):
+    parser.add_argument("bot_name", help="Bot name")
+    parser.add_argument("--configs", nargs="+", required=True, help="Controller config names")
+    parser.add_argument("--account", default="master_account", help="Account name (default: master_account)")
+    parser.add_argument("--image", default="hummingbot/hummingbot:development", help="Docker image")
+    parser.add_argument("--max-global-drawdown", type=float, help="Max global drawdown in quote")
+    parser.add_argument("--max-controller-drawdown", type=float, help="Max controller drawdown in quote")
+    parser.add_argument("--script-config", help="Script config name (auto-generated if not provided)")
+    parser.add_argument("--headless", action="store_true", default=False, help="Run in headless mode")
+    _add_json_arg(parser)
+
+
+def _add_bot_name_args(parser):
+    parser.add_argument("bot_name", help="Bot name")
+    _add_json_arg(parser)
+
+
+def _add_stop_args(parser):
+    parser.add_argument("bot_name", help="Bot name")
+    parser.add_argument("--skip-cancel", action="store_true", help="Skip order cancellation")
+    _add_json_arg(parser)
+
+
+def _add_stop_bots_args(parser):
+    parser.add_argument("bot_names", nargs="+", help="Bot names")
+    parser.add_argument("--skip-cancel", action="store_true", help="Skip order cancellation")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel requests (default: 4)")
+    _add_json_arg(parser)
+
+
+def _add_stop_and_archive_args(parser):
+    parser.add_argument("bot_name", help="Bot name")
+    parser.add_argument("--skip-cancel", action="store_true", help="Skip order cancellation")
+    parser.add_argument("--s3-bucket", help="S3 bucket for archiving (default: local archive)")
+    _add_json_arg(parser)
+
+
+# command -> (handler, help, argument builder)
+COMMANDS = {
+    "template": (get_template, "Get LP Rebalancer config template", _add_json_arg),
+    "create-config": (create_config, "Create LP Rebalancer config", _add_create_config_args),
+    "create-configs-batch": (create_configs_batch, "Create configs from a JSONL file", _add_create_configs_batch_args),
+    "list-configs": (list_configs, "List controller configs", _add_json_arg),
+    "describe-config": (describe_config, "Get config details", _add_config_name_args),
+    "delete-config": (delete_config, "Delete a config", _add_config_name_args),
+    "deploy": (deploy_bot, "Deploy bot with controllers", _add_deploy_args),
+    "status": (get_status, "Get active bots status", _add_json_arg),
+    "bot-status": (get_bot_status, "Get specific bot status", _add_bot_name_args),
+    "stop": (stop_bot, "Stop a bot", _add_stop_args),
+    "stop-bots": (stop_bots, "Stop several bots", _add_stop_bots_args),
+    "stop-and-archive": (stop_and_archive, "Stop and archive a bot", _add_stop_and_archive_args),
+    "batch": (run_batch, "Run subcommands from stdin, one per line", _add_batch_args),
+}
+
+
+def build_parser(command=None):
+    """Build the CLI parser from COMMANDS. If command is given, only its subparser is built."""
     parser = argparse.ArgumentParser(description="Manage LP Rebalancer controllers via hummingbot-api")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # template command
-    template_parser = subparsers.add_parser("template", help="Get LP Rebalancer config template")
-    template_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    template_parser.set_defaults(func=get_template)
-
-    # create-config command
-    create_parser = subparsers.add_parser("create-config", help="Create LP Rebalancer config")
-    create_parser.add_argument("config_name", help="Config name")
-    create_parser.add_argument("--pool", required=True, help="Pool address (from Meteora UI or list_meteora_pools.py)")
-    create_parser.add_argument("--pair", required=True, help="Trading pair matching pool tokens (e.g., SOL-USDC, Percolator-SOL). Use exact token symbols from Gateway.")
-    create_parser.add_argument("--connector", default="meteora/clmm", help="Connector name")
-    create_parser.add_argument("--network", default="solana-mainnet-beta", help="Network")
-    create_parser.add_argument("--amount", type=float, required=True, help="Total amount in QUOTE asset (2nd token in pair). E.g. for Percolator-SOL this is SOL. For SOL-USDC this is USDC.")
-    create_parser.add_argument("--side", type=int, default=0, choices=[0, 1, 2], help="Side: 0=BOTH, 1=BUY (quote only), 2=SELL (base only)")
-    create_parser.add_argument("--width", type=float, default=10.0, help="Position width in pct (e.g. 10 = 10%% of current price above and below)")
-    create_parser.add_argument("--offset", type=float, default=0.1, help="Position offset in pct — how far center of range is from current price (default: 0.1%%)")
-    create_parser.add_argument("--rebalance-seconds", type=int, default=300, help="Seconds out-of-range before rebalancing (default: 300)")
-    create_parser.add_argument("--rebalance-threshold", type=float, default=1.0, help="Rebalance threshold in pct — minimum price movement to trigger rebalance (default: 1.0)")
-    create_parser.add_argument("--sell-max", type=float, default=None, help="Max price for SELL orders (default: null = no limit)")
-    create_parser.add_argument("--sell-min", type=float, default=None, help="Min price for SELL orders (default: null = no limit)")
-    create_parser.add_argument("--buy-max", type=float, default=None, help="Max price for BUY orders (default: null = no limit)")
-    create_parser.add_argument("--buy-min", type=float, default=None, help="Min price for BUY orders (default: null = no limit)")
-    create_parser.add_argument("--strategy-type", type=int, default=0, choices=[0, 1, 2], help="Meteora liquidity shape: 0=Spot (uniform), 1=Curve (concentrated center), 2=Bid-Ask (edges)")
-    create_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    create_parser.set_defaults(func=create_config)
-
-    # list-configs command
-    list_configs_parser = subparsers.add_parser("list-configs", help="List controller configs")
-    list_configs_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    list_configs_parser.set_defaults(func=list_configs)
-
-    # describe-config command
-    describe_parser = subparsers.add_parser("describe-config", help="Get config details")
-    describe_parser.add_argument("config_name", help="Config name")
-    describe_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    describe_parser.set_defaults(func=describe_config)
-
-    # delete-config command
-    delete_parser = subparsers.add_parser("delete-config", help="Delete a config")
-    delete_parser.add_argument("config_name", help="Config name")
-    delete_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    delete_parser.set_defaults(func=delete_config)
-
-    # deploy command
-    deploy_parser = subparsers.add_parser("deploy", help="Deploy bot with controllers")
-    deploy_parser.add_argument("bot_name", help="Bot name")
-    deploy_parser.add_argument("--configs", nargs="+", required=True, help="Controller config names")
-    deploy_parser.add_argument("--account", default="master_account", help="Account name (default: master_account)")
-    deploy_parser.add_argument("--image", default="hummingbot/hummingbot:development", help="Docker image")
-    deploy_parser.add_argument("--max-global-drawdown", type=float, help="Max global drawdown in quote")
-    deploy_parser.add_argument("--max-controller-drawdown", type=float, help="Max controller drawdown in quote")
-    deploy_parser.add_argument("--script-config", help="Script config name (auto-generated if not provided)")
-    deploy_parser.add_argument("--headless", action="store_true", default=False, help="Run in headless mode")
-    deploy_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    deploy_parser.set_defaults(func=deploy_bot)
-
-    # status command
-    status_parser = subparsers.add_parser("status", help="Get active bots status")
-    status_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    status_parser.set_defaults(func=get_status)
-
-    # bot-status command
-    bot_status_parser = subparsers.add_parser("bot-status", help="Get specific bot status")
-    bot_status_parser.add_argument("bot_name", help="Bot name")
-    bot_status_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    bot_status_parser.set_defaults(func=get_bot_status)
-
-    # stop command
-    stop_parser = subparsers.add_parser("stop", help="Stop a bot")
-    stop_parser.add_argument("bot_name", help="Bot name")
-    stop_parser.add_argument("--skip-cancel", action="store_true", help="Skip order cancellation")
-    stop_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    stop_parser.set_defaults(func=stop_bot)
-
-    # stop-and-archive command
-    archive_parser = subparsers.add_parser("stop-and-archive", help="Stop and archive a bot")
-    archive_parser.add_argument("bot_name", help="Bot name")
-    archive_parser.add_argument("--skip-cancel", action="store_true", help="Skip order cancellation")
-    archive_parser.add_argument("--s3-bucket", help="S3 bucket for archiving (default: local archive)")
-    archive_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    archive_parser.set_defaults(func=stop_and_archive)
-
-    args = parser.parse_args()
+    for name, (func, help_text, add_args) in COMMANDS.items():
+        if command and name != command:
+            continue
+        sub = subparsers.add_parser(name, help=help_text)
+        add_args(sub)
+        sub.set_defaults(func=func)
+
+    return parser
+
+
+def main():
+    # Known verb: skip building the other subparsers. Help/unknown input gets the full parser.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    args = build_parser(command if command in COMMANDS else None).parse_args()
     args.func(args)
 
 
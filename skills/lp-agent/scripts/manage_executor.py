@@ -9,11 +9,15 @@ Usage:
     # Get executor status
     python manage_executor.py get <executor_id>
 
+    # Get several executors at once (IDs, or every executor matching list-style filters)
+    python manage_executor.py get-many <id1> <id2> ...
+    python manage_executor.py get-many --type lp_executor --status RUNNING
+
     # List all executors
     python manage_executor.py list [--type lp_executor]
 
     # Get executor logs
-    python manage_executor.py logs <executor_id> [--limit 50]
+    python manage_executor.py logs <executor_id> [--limit 50] [--grep PATTERN]
 
     # Stop executor
     python manage_executor.py stop <executor_id> [--keep-position]
@@ -34,68 +38,230 @@ Environment:
 """
 
 import argparse
+import atexit
+import functools
+import gzip
+import http.client
 import json
 import os
+import re
+import select
 import sys
-import urllib.request
-import urllib.error
+import threading
+import time
+import urllib.parse
 import base64
-from datetime import datetime
+from collections import Counter
+
+# Keep-alive connections per (scheme, host:port), reused by every api_request call.
+# Thread-local so get-many workers each get their own socket.
+_LOCAL = threading.local()
+# Every open pooled connection, across threads, so they can all be closed at exit
+_OPEN_CONNECTIONS = set()
+
+# Idempotent requests are retried on connection failures with exponential backoff
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.2
+_TIMEOUT = 30
+
+# Redirects followed for GET/HEAD, as urllib did (e.g. FastAPI's trailing-slash 307)
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+_ENV_LOADED = False
+
+# KEY=VALUE lines of a .env file; blank lines and lines starting with "#" never match
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
 
 
 def load_env():
-    """Load environment from .env files."""
+    """Load environment from .env files (once per process)."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     for path in ["hummingbot-api/.env", os.path.expanduser("~/.hummingbot/.env"), ".env"]:
         if os.path.exists(path):
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+                text = f.read()
+            for key, value in _ENV_LINE_RE.findall(text):
+                os.environ.setdefault(key, value.strip('"').strip("'"))
             break
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_config():
-    """Get API configuration from environment."""
+    """Get API configuration from environment (memoized per process)."""
     load_env()
-    return {
+    config = {
         "url": os.environ.get("HUMMINGBOT_API_URL", "http://localhost:8000"),
         "user": os.environ.get("API_USER", "admin"),
         "password": os.environ.get("API_PASS", "admin"),
     }
+    # Basic auth header, encoded once alongside the memoized config
+    credentials = base64.b64encode(f"{config['user']}:{config['password']}".encode()).decode()
+    config["auth_header"] = f"Basic {credentials}"
+    # Request headers are identical for every call; http.client only reads this dict
+    config["headers"] = {
+        "Authorization": config["auth_header"],
+        "Content-Type": "application/json",
+        "Accept-Encoding": "gzip",
+    }
+    return config
 
 
 def api_request(method: str, endpoint: str, data=None) -> dict:
     """Make authenticated API request."""
-    config = get_api_config()
-    url = f"{config['url']}{endpoint}"
-
-    # Basic auth
-    credentials = base64.b64encode(f"{config['user']}:{config['password']}".encode()).decode()
-    headers = {
-        "Authorization": f"Basic {credentials}",
-        "Content-Type": "application/json",
-    }
+    raw = api_request_raw(method, endpoint, data)
+    try:
+        return json.loads(raw) if raw else {}
+    except ValueError:
+        print(f"Error: Invalid JSON response from API: {raw[:200].decode(errors='replace')}", file=sys.stderr)
+        sys.exit(1)
 
-    body = json.dumps(data).encode() if data else None
-    req = urllib.request.Request(url, data=body, headers=headers, method=method)
 
+def api_request_raw(method: str, endpoint: str, data=None) -> bytes:
+    """Make authenticated API request and return the unparsed response body."""
+    config = get_api_config()
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
-        print(f"Error: HTTP {e.code} - {e.reason}", file=sys.stderr)
+        status, reason, raw = _api_call(method, endpoint, data)
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Error: Cannot connect to API at {config['url']}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if status >= 300:
+        error_body = raw.decode(errors="replace")
+        print(f"Error: HTTP {status} - {reason}", file=sys.stderr)
         if error_body:
             try:
                 print(json.dumps(json.loads(error_body), indent=2), file=sys.stderr)
             except json.JSONDecodeError:
                 print(error_body, file=sys.stderr)
         sys.exit(1)
-    except urllib.error.URLError as e:
-        print(f"Error: Cannot connect to API at {config['url']}: {e.reason}", file=sys.stderr)
-        sys.exit(1)
+    return raw
+
+
+def _api_call(method: str, endpoint: str, data=None) -> tuple:
+    """Send an authenticated request; returns (status, reason, body bytes) without exiting on errors."""
+    config = get_api_config()
+    url = f"{config['url']}{endpoint}"
+
+    # Compact separators: the API doesn't need whitespace in request bodies
+    body = json.dumps(data, separators=(",", ":")).encode() if data else None
+    return _send(method, url, body, config["headers"])
+
+
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme: str, netloc: str):
+    """(proxy host:port, Proxy-Authorization value or None) for scheme://netloc, or None to connect directly.
+
+    Follows urllib's reading of the http_proxy/https_proxy/no_proxy environment variables.
+    """
+    if not any(name.lower() == f"{scheme}_proxy" for name in os.environ):
+        return None
+    import urllib.request  # only needed once a proxy is configured
+
+    proxy = urllib.request.getproxies_environment().get(scheme)
+    if not proxy or urllib.request.proxy_bypass_environment(netloc):
+        return None
+    proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    auth = None
+    if proxy_parts.username:
+        credentials = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+        auth = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+    return proxy_parts.netloc.rpartition("@")[2], auth
+
+
+def _open_connection(scheme: str, netloc: str, proxy):
+    """New keep-alive connection to netloc, or to the proxy (HTTPS tunnels through it with CONNECT)."""
+    conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    if proxy is None:
+        return conn_cls(netloc, timeout=_TIMEOUT)
+    proxy_netloc, proxy_auth = proxy
+    conn = conn_cls(proxy_netloc, timeout=_TIMEOUT)
+    if scheme == "https":
+        conn.set_tunnel(netloc, headers={"Proxy-Authorization": proxy_auth} if proxy_auth else None)
+    return conn
+
+
+def _connection_dropped(conn) -> bool:
+    """True if an idle pooled socket is readable, i.e. the server closed it (or sent stray data)."""
+    return bool(select.select([conn.sock], [], [], 0)[0])
+
+
+def _send(method: str, url: str, body, headers: dict, redirects: int = 0) -> tuple:
+    """Send a request over the pooled connection for url's host; returns (status, reason, decoded body bytes)."""
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or "/")
+    key = (parts.scheme, parts.netloc)
+    connections = _LOCAL.__dict__.setdefault("connections", {})
+    proxy = _proxy_for(parts.scheme, parts.netloc)
+    request_headers = headers
+    if proxy is not None and parts.scheme == "http":
+        # A plain-HTTP proxy takes the absolute URL as the request target
+        path = urllib.parse.urlunsplit(parts._replace(fragment=""))
+        if proxy[1]:
+            request_headers = {**headers, "Proxy-Authorization": proxy[1]}
+
+    retries = _MAX_RETRIES if method in _IDEMPOTENT_METHODS else 0
+    attempt = 0
+    reconnected = False
+    while True:
+        conn = connections.get(key)
+        if conn is None:
+            conn = connections[key] = _open_connection(parts.scheme, parts.netloc, proxy)
+            _OPEN_CONNECTIONS.add(conn)
+        elif conn.sock is not None and _connection_dropped(conn):
+            # Stale keep-alive socket: send on a fresh one rather than risk a non-idempotent resend
+            conn.close()
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=body, headers=request_headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+            break
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            connections.pop(key, None)
+            _OPEN_CONNECTIONS.discard(conn)
+            if not isinstance(e, ConnectionError) or method not in _IDEMPOTENT_METHODS:
+                raise
+            if reused and not reconnected:
+                # The server closed an idle keep-alive socket — reconnect once right away
+                reconnected = True
+                continue
+            if attempt >= retries:
+                raise
+            time.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+            attempt += 1
+
+    if resp.getheader("Content-Encoding") == "gzip":
+        raw = gzip.decompress(raw)
+    location = resp.getheader("Location")
+    if resp.status in _REDIRECT_STATUSES and location and method in ("GET", "HEAD") and redirects < _MAX_REDIRECTS:
+        target = urllib.parse.urljoin(url, location)
+        if urllib.parse.urlsplit(target)[:2] != parts[:2]:
+            # Never hand the API credentials to another origin
+            headers = {name: value for name, value in headers.items() if name != "Authorization"}
+        return _send(method, target, body, headers, redirects + 1)
+    return resp.status, resp.reason, raw
+
+
+@atexit.register
+def close_connections():
+    """Close every pooled keep-alive connection (registered to run at interpreter exit)."""
+    while _OPEN_CONNECTIONS:
+        _OPEN_CONNECTIONS.pop().close()
+    _LOCAL.__dict__.pop("connections", None)
+
+
+def json_out(obj) -> str:
+    """--json rendering: indented for a terminal, compact when piped to another program."""
+    if sys.stdout.isatty():
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
 
 
 def create_executor(args):
@@ -137,26 +303,84 @@ def get_executor(args):
     result = api_request("GET", f"/executors/{args.executor_id}")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
-        print(f"Executor: {result.get('executor_id', args.executor_id)}")
-        print("-" * 50)
-        print(f"  Type: {result.get('executor_type', result.get('type', ''))}")
-        print(f"  Status: {result.get('status', '')}")
-        print(f"  Trading Pair: {result.get('trading_pair', '')}")
-        print(f"  Connector: {result.get('connector_name', '')}")
-
-        custom_info = result.get("custom_info", {})
-        if custom_info:
-            state = custom_info.get("state", "")
-            if state:
-                print(f"  State: {state}")
-            position_address = custom_info.get("position_address", "")
-            if position_address:
-                print(f"  Position: {position_address[:20]}...")
-
-        pnl = result.get("net_pnl_quote", result.get("pnl", 0))
-        print(f"  PnL: ${pnl:.4f}" if pnl else "  PnL: $0.00")
+        print(format_executor(result, args.executor_id))
+
+
+def format_executor(result: dict, executor_id: str) -> str:
+    """Render one executor's status block."""
+    lines = [
+        f"Executor: {result.get('executor_id', executor_id)}",
+        "-" * 50,
+        f"  Type: {result.get('executor_type', result.get('type', ''))}",
+        f"  Status: {result.get('status', '')}",
+        f"  Trading Pair: {result.get('trading_pair', '')}",
+        f"  Connector: {result.get('connector_name', '')}",
+    ]
+
+    custom_info = result.get("custom_info", {})
+    if custom_info:
+        state = custom_info.get("state", "")
+        if state:
+            lines.append(f"  State: {state}")
+        position_address = custom_info.get("position_address", "")
+        if position_address:
+            lines.append(f"  Position: {position_address[:20]}...")
+
+    pnl = result.get("net_pnl_quote", result.get("pnl", 0))
+    lines.append(f"  PnL: ${pnl:.4f}" if pnl else "  PnL: $0.00")
+    return "\n".join(lines)
+
+
+def get_many_executors(args):
+    """Get several executors concurrently (the given IDs, or every executor matching the list filters)."""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    executor_ids = args.executor_ids
+    if not executor_ids:
+        filter_request = {"limit": args.limit}
+        if args.type:
+            filter_request["executor_types"] = [args.type]
+        if args.status:
+            filter_request["status"] = args.status
+        result = api_request("POST", "/executors/search", filter_request)
+        executor_ids = [ex["executor_id"] for ex in result.get("data", []) if ex.get("executor_id")]
+        if not executor_ids:
+            print("No executors found.")
+            return
+
+    def fetch(executor_id):
+        try:
+            status, reason, raw = _api_call("GET", f"/executors/{executor_id}")
+        except (OSError, http.client.HTTPException) as e:
+            return executor_id, None, str(e)
+        if status >= 300:
+            return executor_id, None, f"HTTP {status} - {reason}: {raw.decode(errors='replace')}"
+        try:
+            return executor_id, json.loads(raw), None
+        except ValueError:
+            return executor_id, None, "invalid JSON response"
+
+    results = {}
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        futures = [pool.submit(fetch, executor_id) for executor_id in executor_ids]
+        # Text output streams each executor as soon as its response arrives
+        for future in as_completed(futures):
+            executor_id, result, error = future.result()
+            failed += error is not None
+            if args.json:
+                results[executor_id] = result if error is None else {"error": error}
+            elif error is None:
+                print(format_executor(result, executor_id) + "\n", flush=True)
+            else:
+                print(f"✗ {executor_id}: {error}\n", flush=True)
+
+    if args.json:
+        print(json_out({executor_id: results[executor_id] for executor_id in executor_ids}))
+    if failed:
+        sys.exit(1)
 
 
 def list_executors(args):
@@ -174,7 +398,7 @@ def list_executors(args):
     result = api_request("POST", "/executors/search", filter_request)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         executors = result.get("data", [])
         pagination = result.get("pagination", {})
@@ -183,43 +407,72 @@ def list_executors(args):
             print("No executors found.")
             return
 
-        print(f"Executors ({pagination.get('total_count', len(executors))} total):")
-        print("-" * 110)
-        print(f"{'ID':<46} {'Type':<15} {'Status':<12} {'Pair':<15} {'PnL':<10}")
-        print("-" * 110)
-
+        lines = [
+            f"Executors ({pagination.get('total_count', len(executors))} total):",
+            "-" * 110,
+            f"{'ID':<46} {'Type':<15} {'Status':<12} {'Pair':<15} {'PnL':<10}",
+            "-" * 110,
+        ]
+        # Width.precision pads and truncates in one format call per field
+        row = "{executor_id:<46} {executor_type:<15.13} {status:<12.10} {trading_pair:<15.13} {pnl:<10}".format_map
+        blank = {"executor_id": "", "status": "", "trading_pair": ""}
         for ex in executors:
-            ex_id = ex.get("executor_id", "")
-            ex_type = ex.get("executor_type", ex.get("type", ""))[:13]
-            status = ex.get("status", "")[:10]
-            pair = ex.get("trading_pair", "")[:13]
             pnl = ex.get("net_pnl_quote", ex.get("pnl", 0))
-            pnl_str = f"${pnl:.2f}" if pnl else "$0.00"
-            print(f"{ex_id:<46} {ex_type:<15} {status:<12} {pair:<15} {pnl_str:<10}")
+            lines.append(row({
+                **blank,
+                **ex,
+                "executor_type": ex.get("executor_type", ex.get("type", "")),
+                "pnl": f"${pnl:.2f}" if pnl else "$0.00",
+            }))
+        print("\n".join(lines))
 
 
 def get_logs(args):
     """Get executor logs."""
-    params = [f"limit={args.limit}"]
+    pattern = None
+    if args.grep:
+        try:
+            pattern = re.compile(args.grep)
+        except re.error as e:
+            print(f"Error: Invalid --grep pattern: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    params = {"limit": args.limit}
     if args.level:
-        params.append(f"level={args.level}")
+        params["level"] = args.level
+
+    endpoint = f"/executors/{args.executor_id}/logs?{urllib.parse.urlencode(params)}"
+
+    if args.json and not pattern and not sys.stdout.isatty():
+        # Piped --json: pass the server's JSON through without a parse + re-indent round-trip
+        raw = api_request_raw("GET", endpoint)
+        sys.stdout.flush()
+        sys.stdout.buffer.write(raw.rstrip() + b"\n")
+        sys.stdout.buffer.flush()
+        return
 
-    endpoint = f"/executors/{args.executor_id}/logs?{'&'.join(params)}"
     result = api_request("GET", endpoint)
 
+    if pattern and isinstance(result.get("logs"), list):
+        # Filter the already-parsed entries in-process instead of piping --json through jq
+        result["logs"] = [log for log in result["logs"] if pattern.search(str(log.get("message", log)))]
+        # total_count is the server's pre-filter count; matched_count is what --grep kept
+        result["matched_count"] = len(result["logs"])
+
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         logs = result.get("logs", [])
         total = result.get("total_count", len(logs))
-        print(f"Logs for {args.executor_id} ({total} total, showing {len(logs)}):")
-        print("-" * 80)
+        lines = [f"Logs for {args.executor_id} ({total} total, showing {len(logs)}):", "-" * 80]
 
-        for log in logs:
-            ts = log.get("timestamp", "")
-            level = log.get("level", "INFO")
-            msg = log.get("message", str(log))
-            print(f"[{ts}] {level}: {msg}")
+        # One preformatted template for every entry, joined into a single write
+        fmt = "[%s] %s: %s".__mod__
+        lines.extend(
+            fmt((log.get("timestamp", ""), log.get("level", "INFO"), log.get("message", log)))
+            for log in logs
+        )
+        print("\n".join(lines))
 
 
 def stop_executor(args):
@@ -228,7 +481,7 @@ def stop_executor(args):
     result = api_request("POST", f"/executors/{args.executor_id}/stop", data)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if result.get("success"):
             print(f"✓ Executor {args.executor_id} stopped")
@@ -245,7 +498,7 @@ def get_summary(args):
     result = api_request("GET", "/executors/summary")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         print("Executor Summary")
         print("-" * 40)
@@ -256,13 +509,13 @@ def get_summary(args):
         by_type = result.get("by_type", {})
         if by_type:
             print("\n  By Type:")
-            for t, count in by_type.items():
+            for t, count in Counter(by_type).most_common():
                 print(f"    {t}: {count}")
 
         by_status = result.get("by_status", {})
         if by_status:
             print("\n  By Status:")
-            for s, count in by_status.items():
+            for s, count in Counter(by_status).most_common():
                 print(f"    {s}: {count}")
 
 
@@ -271,7 +524,7 @@ def get_positions_summary(args):
     result = api_request("GET", "/executors/positions/summary")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         print("Positions Summary")
         print("-" * 60)
@@ -308,7 +561,7 @@ def get_config_schema(args):
     result = api_request("GET", f"/executors/types/{args.executor_type}/config")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         print(f"Config Schema: {result.get('executor_type', args.executor_type)}")
         print(f"Config Class: {result.get('config_class', '')}")
@@ -337,73 +590,99 @@ def get_config_schema(args):
                 print(f"  {type_name}: {type_info.get('description', '')[:50]}")
 
 
-def main():
+def _add_json_arg(parser):
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+
+def _add_create_args(parser):
+    parser.add_argument("--pool", required=True, help="Pool address")
+    parser.add_argument("--pair", required=True, help="Trading pair (e.g., SOL-USDC)")
+    parser.add_argument("--connector", default="meteora/clmm", help="Connector name (default: meteora/clmm)")
+    parser.add_argument("--lower", type=float, required=True, help="Lower price bound")
+    parser.add_argument("--upper", type=float, required=True, help="Upper price bound")
+    parser.add_argument("--base-amount", type=float, default=0, help="Base token amount (default: 0)")
+    parser.add_argument("--quote-amount", type=float, default=0, help="Quote token amount")
+    parser.add_argument("--side", type=int, default=1, choices=[0, 1, 2], help="Side: 0=BOTH, 1=BUY, 2=SELL (default: 1)")
+    parser.add_argument("--auto-close-above", type=int, help="Auto-close seconds when price above range")
+    parser.add_argument("--auto-close-below", type=int, help="Auto-close seconds when price below range")
+    parser.add_argument("--strategy-type", type=int, choices=[0, 1, 2], help="Meteora strategy: 0=Spot, 1=Curve, 2=Bid-Ask")
+    parser.add_argument("--account", default="master_account", help="Account name (default: master_account)")
+
+
+def _add_get_args(parser):
+    parser.add_argument("executor_id", help="Executor ID")
+    _add_json_arg(parser)
+
+
+def _add_get_many_args(parser):
+    parser.add_argument("executor_ids", nargs="*", help="Executor IDs (default: every executor matching the filters)")
+    parser.add_argument("--type", help="Filter by executor type when no IDs are given (e.g., lp_executor)")
+    parser.add_argument("--status", help="Filter by status when no IDs are given (e.g., RUNNING)")
+    parser.add_argument("--limit", type=int, default=50, help="Max executors when no IDs are given (default: 50)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Parallel requests (default: 10)")
+    _add_json_arg(parser)
+
+
+def _add_list_args(parser):
+    parser.add_argument("--type", help="Filter by executor type (e.g., lp_executor)")
+    parser.add_argument("--status", help="Filter by status (e.g., RUNNING, TERMINATED)")
+    parser.add_argument("--limit", type=int, default=50, help="Max results (default: 50)")
+    _add_json_arg(parser)
+
+
+def _add_logs_args(parser):
+    parser.add_argument("executor_id", help="Executor ID")
+    parser.add_argument("--limit", type=int, default=50, help="Number of log entries (default: 50)")
+    parser.add_argument("--level", choices=["ERROR", "WARNING", "INFO", "DEBUG"], help="Filter by log level")
+    parser.add_argument("--grep", metavar="PATTERN", help="Only show entries whose message matches this regex")
+    _add_json_arg(parser)
+
+
+def _add_stop_args(parser):
+    parser.add_argument("executor_id", help="Executor ID")
+    parser.add_argument("--keep-position", action="store_true", help="Keep position on-chain (don't close)")
+    _add_json_arg(parser)
+
+
+def _add_config_args(parser):
+    parser.add_argument("executor_type", help="Executor type: position_executor, grid_executor, dca_executor, arbitrage_executor, twap_executor, xemm_executor, order_executor")
+    _add_json_arg(parser)
+    parser.add_argument("--brief", action="store_true", help="Show brief output (skip nested types)")
+
+
+# command -> (handler, help, argument builder)
+COMMANDS = {
+    "create": (create_executor, "Create LP executor", _add_create_args),
+    "get": (get_executor, "Get executor status", _add_get_args),
+    "get-many": (get_many_executors, "Get several executors concurrently", _add_get_many_args),
+    "list": (list_executors, "List executors", _add_list_args),
+    "logs": (get_logs, "Get executor logs", _add_logs_args),
+    "stop": (stop_executor, "Stop executor", _add_stop_args),
+    "summary": (get_summary, "Get executor summary", _add_json_arg),
+    "positions": (get_positions_summary, "Get held positions summary", _add_json_arg),
+    "config": (get_config_schema, "Get executor config schema", _add_config_args),
+}
+
+
+def build_parser(command=None):
+    """Build the CLI parser from COMMANDS. If command is given, only its subparser is built."""
     parser = argparse.ArgumentParser(description="Manage LP executors via hummingbot-api")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # create command
-    create_parser = subparsers.add_parser("create", help="Create LP executor")
-    create_parser.add_argument("--pool", required=True, help="Pool address")
-    create_parser.add_argument("--pair", required=True, help="Trading pair (e.g., SOL-USDC)")
-    create_parser.add_argument("--connector", default="meteora/clmm", help="Connector name (default: meteora/clmm)")
-    create_parser.add_argument("--lower", type=float, required=True, help="Lower price bound")
-    create_parser.add_argument("--upper", type=float, required=True, help="Upper price bound")
-    create_parser.add_argument("--base-amount", type=float, default=0, help="Base token amount (default: 0)")
-    create_parser.add_argument("--quote-amount", type=float, default=0, help="Quote token amount")
-    create_parser.add_argument("--side", type=int, default=1, choices=[0, 1, 2], help="Side: 0=BOTH, 1=BUY, 2=SELL (default: 1)")
-    create_parser.add_argument("--auto-close-above", type=int, help="Auto-close seconds when price above range")
-    create_parser.add_argument("--auto-close-below", type=int, help="Auto-close seconds when price below range")
-    create_parser.add_argument("--strategy-type", type=int, choices=[0, 1, 2], help="Meteora strategy: 0=Spot, 1=Curve, 2=Bid-Ask")
-    create_parser.add_argument("--account", default="master_account", help="Account name (default: master_account)")
-    create_parser.set_defaults(func=create_executor)
-
-    # get command
-    get_parser = subparsers.add_parser("get", help="Get executor status")
-    get_parser.add_argument("executor_id", help="Executor ID")
-    get_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    get_parser.set_defaults(func=get_executor)
-
-    # list command
-    list_parser = subparsers.add_parser("list", help="List executors")
-    list_parser.add_argument("--type", help="Filter by executor type (e.g., lp_executor)")
-    list_parser.add_argument("--status", help="Filter by status (e.g., RUNNING, TERMINATED)")
-    list_parser.add_argument("--limit", type=int, default=50, help="Max results (default: 50)")
-    list_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    list_parser.set_defaults(func=list_executors)
-
-    # logs command
-    logs_parser = subparsers.add_parser("logs", help="Get executor logs")
-    logs_parser.add_argument("executor_id", help="Executor ID")
-    logs_parser.add_argument("--limit", type=int, default=50, help="Number of log entries (default: 50)")
-    logs_parser.add_argument("--level", choices=["ERROR", "WARNING", "INFO", "DEBUG"], help="Filter by log level")
-    logs_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    logs_parser.set_defaults(func=get_logs)
-
-    # stop command
-    stop_parser = subparsers.add_parser("stop", help="Stop executor")
-    stop_parser.add_argument("executor_id", help="Executor ID")
-    stop_parser.add_argument("--keep-position", action="store_true", help="Keep position on-chain (don't close)")
-    stop_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    stop_parser.set_defaults(func=stop_executor)
-
-    # summary command
-    summary_parser = subparsers.add_parser("summary", help="Get executor summary")
-    summary_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    summary_parser.set_defaults(func=get_summary)
-
-    # positions command
-    positions_parser = subparsers.add_parser("positions", help="Get held positions summary")
-    positions_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    positions_parser.set_defaults(func=get_positions_summary)
-
-    # config command
-    config_parser = subparsers.add_parser("config", help="Get executor config schema")
-    config_parser.add_argument("executor_type", help="Executor type: position_executor, grid_executor, dca_executor, arbitrage_executor, twap_executor, xemm_executor, order_executor")
-    config_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    config_parser.add_argument("--brief", action="store_true", help="Show brief output (skip nested types)")
-    config_parser.set_defaults(func=get_config_schema)
-
-    args = parser.parse_args()
+    for name, (func, help_text, add_args) in COMMANDS.items():
+        if command and name != command:
+            continue
+        sub = subparsers.add_parser(name, help=help_text)
+        add_args(sub)
+        sub.set_defaults(func=func)
+
+    return parser
+
+
+def main():
+    # Known verb: skip building the other subparsers. Help/unknown input gets the full parser.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    args = build_parser(command if command in COMMANDS else None).parse_args()
     args.func(args)
 
 
@@ -30,35 +30,71 @@ Environment:
 """
 
 import argparse
+import atexit
+import functools
+import gzip
+import http.client
 import json
 import os
+import re
+import select
 import sys
-import urllib.request
-import urllib.error
+import threading
+import time
+import urllib.parse
 import base64
 
+# Keep-alive connections per (scheme, host:port), reused by every api_request call
+_LOCAL = threading.local()
+# Every open pooled connection, across threads, so they can all be closed at exit
+_OPEN_CONNECTIONS = set()
+
+# Idempotent requests are retried on connection failures with exponential backoff
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.2
+# Gateway start/restart can take a while, hence the longer timeout
+_TIMEOUT = 60
+
+# Redirects followed for GET/HEAD, as urllib did (e.g. FastAPI's trailing-slash 307)
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_MAX_REDIRECTS = 5
+
+
+_ENV_LOADED = False
+
+# KEY=VALUE lines of a .env file; blank lines and lines starting with "#" never match
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#=\s][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.MULTILINE)
+
 
 def load_env():
-    """Load environment from .env files."""
+    """Load environment from .env files (once per process)."""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    _ENV_LOADED = True
     for path in ["hummingbot-api/.env", os.path.expanduser("~/.hummingbot/.env"), ".env"]:
         if os.path.exists(path):
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ.setdefault(key.strip(), value.strip().strip('"').strip("'"))
+                text = f.read()
+            for key, value in _ENV_LINE_RE.findall(text):
+                os.environ.setdefault(key, value.strip('"').strip("'"))
             break
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_config():
-    """Get API configuration from environment."""
+    """Get API configuration from environment (memoized per process)."""
     load_env()
-    return {
+    config = {
         "url": os.environ.get("HUMMINGBOT_API_URL", "http://localhost:8000"),
         "user": os.environ.get("API_USER", "admin"),
         "password": os.environ.get("API_PASS", "admin"),
     }
+    # Basic auth header, encoded once alongside the memoized config
+    credentials = base64.b64encode(f"{config['user']}:{config['password']}".encode()).decode()
+    config["auth_header"] = f"Basic {credentials}"
+    return config
 
 
 def api_request(method: str, endpoint: str, data=None) -> dict:
@@ -66,39 +102,153 @@ def api_request(method: str, endpoint: str, data=None) -> dict:
     config = get_api_config()
     url = f"{config['url']}{endpoint}"
 
-    # Basic auth
-    credentials = base64.b64encode(f"{config['user']}:{config['password']}".encode()).decode()
     headers = {
-        "Authorization": f"Basic {credentials}",
+        "Authorization": config["auth_header"],
         "Content-Type": "application/json",
+        "Accept-Encoding": "gzip",
     }
 
     body = json.dumps(data).encode() if data else None
-    req = urllib.request.Request(url, data=body, headers=headers, method=method)
 
     try:
-        with urllib.request.urlopen(req, timeout=60) as resp:
-            return json.loads(resp.read().decode())
-    except urllib.error.HTTPError as e:
-        error_body = e.read().decode() if e.fp else ""
-        print(f"Error: HTTP {e.code} - {e.reason}", file=sys.stderr)
+        status, reason, raw = _send(method, url, body, headers)
+    except (OSError, http.client.HTTPException) as e:
+        print(f"Error: Cannot connect to API at {config['url']}: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if status >= 300:
+        error_body = raw.decode(errors="replace")
+        print(f"Error: HTTP {status} - {reason}", file=sys.stderr)
         if error_body:
             try:
                 print(json.dumps(json.loads(error_body), indent=2), file=sys.stderr)
             except json.JSONDecodeError:
                 print(error_body, file=sys.stderr)
         sys.exit(1)
-    except urllib.error.URLError as e:
-        print(f"Error: Cannot connect to API at {config['url']}: {e.reason}", file=sys.stderr)
+    try:
+        return json.loads(raw) if raw else {}
+    except ValueError:
+        print(f"Error: Invalid JSON response from API: {raw[:200].decode(errors='replace')}", file=sys.stderr)
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=None)
+def _proxy_for(scheme: str, netloc: str):
+    """(proxy host:port, Proxy-Authorization value or None) for scheme://netloc, or None to connect directly.
+
+    Follows urllib's reading of the http_proxy/https_proxy/no_proxy environment variables.
+    """
+    if not any(name.lower() == f"{scheme}_proxy" for name in os.environ):
+        return None
+    import urllib.request  # only needed once a proxy is configured
+
+    proxy = urllib.request.getproxies_environment().get(scheme)
+    if not proxy or urllib.request.proxy_bypass_environment(netloc):
+        return None
+    proxy_parts = urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+    auth = None
+    if proxy_parts.username:
+        credentials = f"{urllib.parse.unquote(proxy_parts.username)}:{urllib.parse.unquote(proxy_parts.password or '')}"
+        auth = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+    return proxy_parts.netloc.rpartition("@")[2], auth
+
+
+def _open_connection(scheme: str, netloc: str, proxy):
+    """New keep-alive connection to netloc, or to the proxy (HTTPS tunnels through it with CONNECT)."""
+    conn_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+    if proxy is None:
+        return conn_cls(netloc, timeout=_TIMEOUT)
+    proxy_netloc, proxy_auth = proxy
+    conn = conn_cls(proxy_netloc, timeout=_TIMEOUT)
+    if scheme == "https":
+        conn.set_tunnel(netloc, headers={"Proxy-Authorization": proxy_auth} if proxy_auth else None)
+    return conn
+
+
+def _connection_dropped(conn) -> bool:
+    """True if an idle pooled socket is readable, i.e. the server closed it (or sent stray data)."""
+    return bool(select.select([conn.sock], [], [], 0)[0])
+
+
+def _send(method: str, url: str, body, headers: dict, redirects: int = 0) -> tuple:
+    """Send a request over the pooled connection for url's host; returns (status, reason, decoded body bytes)."""
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or "/")
+    key = (parts.scheme, parts.netloc)
+    connections = _LOCAL.__dict__.setdefault("connections", {})
+    proxy = _proxy_for(parts.scheme, parts.netloc)
+    request_headers = headers
+    if proxy is not None and parts.scheme == "http":
+        # A plain-HTTP proxy takes the absolute URL as the request target
+        path = urllib.parse.urlunsplit(parts._replace(fragment=""))
+        if proxy[1]:
+            request_headers = {**headers, "Proxy-Authorization": proxy[1]}
+
+    retries = _MAX_RETRIES if method in _IDEMPOTENT_METHODS else 0
+    attempt = 0
+    reconnected = False
+    while True:
+        conn = connections.get(key)
+        if conn is None:
+            conn = connections[key] = _open_connection(parts.scheme, parts.netloc, proxy)
+            _OPEN_CONNECTIONS.add(conn)
+        elif conn.sock is not None and _connection_dropped(conn):
+            # Stale keep-alive socket: send on a fresh one rather than risk a non-idempotent resend
+            conn.close()
+        reused = conn.sock is not None
+        try:
+            conn.request(method, path, body=body, headers=request_headers)
+            resp = conn.getresponse()
+            raw = resp.read()
+            break
+        except (OSError, http.client.HTTPException) as e:
+            conn.close()
+            connections.pop(key, None)
+            _OPEN_CONNECTIONS.discard(conn)
+            if not isinstance(e, ConnectionError) or method not in _IDEMPOTENT_METHODS:
+                raise
+            if reused and not reconnected:
+                # The server closed an idle keep-alive socket — reconnect once right away
+                reconnected = True
+                continue
+            if attempt >= retries:
+                raise
+            time.sleep(_BACKOFF_FACTOR * 2 ** attempt)
+            attempt += 1
+
+    if resp.getheader("Content-Encoding") == "gzip":
+        raw = gzip.decompress(raw)
+    location = resp.getheader("Location")
+    if resp.status in _REDIRECT_STATUSES and location and method in ("GET", "HEAD") and redirects < _MAX_REDIRECTS:
+        target = urllib.parse.urljoin(url, location)
+        if urllib.parse.urlsplit(target)[:2] != parts[:2]:
+            # Never hand the API credentials to another origin
+            headers = {name: value for name, value in headers.items() if name != "Authorization"}
+        return _send(method, target, body, headers, redirects + 1)
+    return resp.status, resp.reason, raw
+
+
+@atexit.register
+def close_connections():
+    """Close every pooled keep-alive connection (registered to run at interpreter exit)."""
+    while _OPEN_CONNECTIONS:
+        _OPEN_CONNECTIONS.pop().close()
+    _LOCAL.__dict__.pop("connections", None)
+
+
+def json_out(obj) -> str:
+    """--json rendering: indented for a terminal, compact when piped to another program."""
+    if sys.stdout.isatty():
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
 def get_status(args):
     """Get Gateway status."""
     result = api_request("GET", "/gateway/status")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         is_running = result.get("running", False)
         container_id = result.get("container_id", "")
@@ -131,7 +281,7 @@ def start_gateway(args):
     result = api_request("POST", "/gateway/start", data)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if result.get("success"):
             print("✓ Gateway started successfully")
@@ -145,7 +295,7 @@ def stop_gateway(args):
     result = api_request("POST", "/gateway/stop")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if result.get("success"):
             print("✓ Gateway stopped")
@@ -169,7 +319,7 @@ def restart_gateway(args):
     result = api_request("POST", "/gateway/restart", data)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if result.get("success"):
             print("✓ Gateway restarted successfully")
@@ -183,7 +333,7 @@ def get_logs(args):
     result = api_request("GET", endpoint)
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         if result.get("success"):
             logs = result.get("logs", "")
@@ -201,7 +351,7 @@ def list_networks(args):
     result = api_request("GET", "/gateway/networks")
 
     if args.json:
-        print(json.dumps(result, indent=2))
+        print(json_out(result))
     else:
         networks = result.get("networks", [])
         count = result.get("count", len(networks))
@@ -232,7 +382,7 @@ def get_network(args):
         result = api_request("POST", f"/gateway/networks/{args.network_id}", data)
 
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(json_out(result))
         else:
             if result.get("success"):
                 print(f"✓ Network {args.network_id} updated")
@@ -247,7 +397,7 @@ def get_network(args):
         result = api_request("GET", f"/gateway/networks/{args.network_id}")
 
         if args.json:
-            print(json.dumps(result, indent=2))
+            print(json_out(result))
         else:
             print(f"Network: {args.network_id}")
             print("-" * 40)
@@ -263,55 +413,66 @@ def get_network(args):
                     print(f"  {key}: {value}")
 
 
-def main():
+def _add_json_arg(parser):
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+
+def _add_start_args(parser):
+    parser.add_argument("--passphrase", default="hummingbot", help="Gateway passphrase (default: hummingbot)")
+    parser.add_argument("--image", default="hummingbot/gateway:latest", help="Docker image")
+    parser.add_argument("--port", type=int, default=15888, help="Port (default: 15888)")
+    _add_json_arg(parser)
+
+
+def _add_restart_args(parser):
+    parser.add_argument("--passphrase", help="Gateway passphrase (optional, uses existing config if not provided)")
+    parser.add_argument("--image", help="Docker image")
+    parser.add_argument("--port", type=int, help="Port")
+    _add_json_arg(parser)
+
+
+def _add_logs_args(parser):
+    parser.add_argument("--limit", type=int, default=100, help="Number of log lines (default: 100)")
+    _add_json_arg(parser)
+
+
+def _add_network_args(parser):
+    parser.add_argument("network_id", help="Network ID (e.g., solana-mainnet-beta)")
+    parser.add_argument("--node-url", help="Set custom RPC node URL")
+    _add_json_arg(parser)
+
+
+# command -> (handler, help, argument builder)
+COMMANDS = {
+    "status": (get_status, "Get Gateway status", _add_json_arg),
+    "start": (start_gateway, "Start Gateway", _add_start_args),
+    "stop": (stop_gateway, "Stop Gateway", _add_json_arg),
+    "restart": (restart_gateway, "Restart Gateway", _add_restart_args),
+    "logs": (get_logs, "Get Gateway logs", _add_logs_args),
+    "networks": (list_networks, "List all networks", _add_json_arg),
+    "network": (get_network, "Get or update network config", _add_network_args),
+}
+
+
+def build_parser(command=None):
+    """Build the CLI parser from COMMANDS. If command is given, only its subparser is built."""
     parser = argparse.ArgumentParser(description="Manage Gateway via hummingbot-api")
     subparsers = parser.add_subparsers(dest="command", required=True)
 
-    # status command
-    status_parser = subparsers.add_parser("status", help="Get Gateway status")
-    status_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    status_parser.set_defaults(func=get_status)
-
-    # start command
-    start_parser = subparsers.add_parser("start", help="Start Gateway")
-    start_parser.add_argument("--passphrase", default="hummingbot", help="Gateway passphrase (default: hummingbot)")
-    start_parser.add_argument("--image", default="hummingbot/gateway:latest", help="Docker image")
-    start_parser.add_argument("--port", type=int, default=15888, help="Port (default: 15888)")
-    start_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    start_parser.set_defaults(func=start_gateway)
-
-    # stop command
-    stop_parser = subparsers.add_parser("stop", help="Stop Gateway")
-    stop_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    stop_parser.set_defaults(func=stop_gateway)
-
-    # restart command
-    restart_parser = subparsers.add_parser("restart", help="Restart Gateway")
-    restart_parser.add_argument("--passphrase", help="Gateway passphrase (optional, uses existing config if not provided)")
-    restart_parser.add_argument("--image", help="Docker image")
-    restart_parser.add_argument("--port", type=int, help="Port")
-    restart_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    restart_parser.set_defaults(func=restart_gateway)
-
-    # logs command
-    logs_parser = subparsers.add_parser("logs", help="Get Gateway logs")
-    logs_parser.add_argument("--limit", type=int, default=100, help="Number of log lines (default: 100)")
-    logs_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    logs_parser.set_defaults(func=get_logs)
-
-    # networks command (list all)
-    networks_parser = subparsers.add_parser("networks", help="List all networks")
-    networks_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    networks_parser.set_defaults(func=list_networks)
-
-    # network command (get/update single network)
-    network_parser = subparsers.add_parser("network", help="Get or update network config")
-    network_parser.add_argument("network_id", help="Network ID (e.g., solana-mainnet-beta)")
-    network_parser.add_argument("--node-url", help="Set custom RPC node URL")
-    network_parser.add_argument("--json", action="store_true", help="Output as JSON")
-    network_parser.set_defaults(func=get_network)
-
-    args = parser.parse_args()
+    for name, (func, help_text, add_args) in COMMANDS.items():
+        if command and name != command:
+            continue
+        sub = subparsers.add_parser(name, help=help_text)
+        add_args(sub)
+        sub.set_defaults(func=func)
+
+    return parser
+
+
+def main():
+    # Known verb: skip building the other subparsers. Help/unknown input gets the full parser.
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+    args = build_parser(command if command in COMMANDS else None).parse_args()
     args.func(args)
 
 
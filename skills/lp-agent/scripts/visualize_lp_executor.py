@@ -66,7 +66,7 @@ def api_get(url, hdrs, timeout=30):
     req = urllib.request.Request(url, headers=hdrs, method="GET")
     try:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
+            return json.loads(resp.read())
     except urllib.error.HTTPError as e:
         raise RuntimeError(f"HTTP {e.code}: {e.read().decode(errors='replace')}") from e
     except urllib.error.URLError as e:
@@ -80,7 +80,7 @@ def api_post(url, payload, hdrs, timeout=30):
                                   method="POST")
     try:
         with urllib.request.urlopen(req, timeout=timeout) as resp:
-            return json.loads(resp.read().decode())
+            return json.loads(resp.read())
     except urllib.error.HTTPError as e:
         raise RuntimeError(f"HTTP {e.code}: {e.read().decode(errors='replace')}") from e
     except urllib.error.URLError as e: